@@ -1,17 +1,118 @@
+import math
+from fractions import Fraction
 import numpy as np
+from numba import njit, prange
 from scipy import signal
-from scipy.signal import butter, filtfilt
+from scipy.signal import butter, resample_poly, sosfilt, sosfilt_zi, sosfiltfilt
 from typing import Optional
 
+
+# Kernels are compiled eagerly for these signatures when the module is
+# imported; cache=True stores the machine code so later launches load it
+# from __pycache__ instead of compiling again.
+_FUSED_CHAIN_SIGNATURES = [
+    "float32[:](float32[:], int64[:], float64[:], float64, boolean, float32[:])",
+    "float32[:](float64[:], int64[:], float64[:], float64, boolean, float32[:])",
+]
+_STATS_SIGNATURES = [
+    "UniTuple(float64, 3)(float32[:])",
+]
+
+
+@njit(_FUSED_CHAIN_SIGNATURES, parallel=True, fastmath=True, cache=True)
+def _fused_chain(x, tap_delays, tap_gains, distortion, clip, out):
+    """
+    Apply delay taps, soft-clip distortion and hard clipping in one pass
+    
+    Args:
+        x: Input audio data
+        tap_delays: Delay of each tap in samples
+        tap_gains: Gain of each tap
+        distortion: Distortion amount (0.0 disables it)
+        clip: Clip the output to [-1.0, 1.0]
+        out: Output buffer (float32), may be x itself if all delays are 0
+        
+    Returns:
+        The output buffer
+    """
+    n = x.shape[0]
+    threshold = 1.0 - distortion
+    
+    for i in prange(n):
+        y = 0.0
+        for k in range(tap_delays.shape[0]):
+            j = i - tap_delays[k]
+            if j >= 0:
+                y += tap_gains[k] * x[j]
+        
+        if distortion > 0.0:
+            a = abs(y)
+            if a > threshold:
+                soft = threshold + distortion * math.tanh((a - threshold) / distortion)
+                y = soft if y >= 0.0 else -soft
+        
+        if clip:
+            if y > 1.0:
+                y = 1.0
+            elif y < -1.0:
+                y = -1.0
+        
+        out[i] = y
+    
+    return out
+
+
+@njit(_STATS_SIGNATURES, fastmath=True, cache=True)
+def _stats(x):
+    """
+    Compute peak amplitude, mean and mean square in a single pass
+    
+    Args:
+        x: Input audio data
+        
+    Returns:
+        Tuple of (max_amplitude, mean, mean_square)
+    """
+    n = x.shape[0]
+    total = 0.0
+    total_sq = 0.0
+    peak = 0.0
+    
+    for i in range(n):
+        v = x[i]
+        a = -v if v < 0 else v
+        if a > peak:
+            peak = a
+        total += v
+        total_sq += v * v
+    
+    return peak, total / n, total_sq / n
+
+
 class DSPProcessor:
-    def __init__(self):
-        """Initialize the DSP processor"""
-        pass
+    def __init__(self, realtime: bool = False):
+        """
+        Initialize the DSP processor
+        
+        Args:
+            realtime: Filter causally in a single pass, keeping filter state
+                      between calls so audio can be processed in chunks.
+                      When False, filters run forward and backward (zero phase).
+        """
+        self.realtime = realtime
+        
+        # Butterworth designs keyed by (order, cutoff_hz, sample_rate, btype)
+        self._filter_cache = {}
+        # Robot voice modulation envelopes keyed by sample_rate
+        self._carrier_cache = {}
+        # Per-filter state for realtime (chunked) filtering
+        self._filter_state = {}
     
     def process_audio(self, audio_data: np.ndarray, gain: float = 1.0, echo: float = 0.0,
                      lowpass: bool = False, highpass: bool = False, 
                      robot: bool = False, reverb: bool = False,
-                     pitch: float = 1.0, chorus: bool = False, distortion: float = 0.0) -> np.ndarray:
+                     pitch: float = 1.0, chorus: bool = False, distortion: float = 0.0,
+                     device: str = 'cpu') -> np.ndarray:
         """
         Process audio with multiple effects
         
@@ -26,32 +127,60 @@ class DSPProcessor:
             pitch: Pitch shift factor (0.5 = octave down, 2.0 = octave up)
             chorus: Apply chorus effect
             distortion: Distortion amount (0.0 to 1.0)
+            device: 'cpu', or a PyTorch device such as 'cuda' to process on
+                    the GPU (requires torch and julius)
             
         Returns:
             Processed audio data
         """
-        # Flatten to 1D
-        audio_data = np.ravel(audio_data)
-        processed_audio = audio_data.copy()
+        # Flatten to 1D float32 so every stage works on half-width samples
+        audio_data = np.ascontiguousarray(np.ravel(audio_data), dtype=np.float32)
+        # The compiled kernels only take writeable arrays
+        if not audio_data.flags.writeable:
+            audio_data = audio_data.copy()
+        
+        if device != 'cpu':
+            try:
+                return self._process_audio_torch(
+                    audio_data, device, gain=gain, echo=echo, lowpass=lowpass,
+                    highpass=highpass, robot=robot, reverb=reverb, pitch=pitch,
+                    chorus=chorus, distortion=distortion
+                )
+            except ImportError:
+                print("PyTorch/julius not available, processing on CPU")
+        
+        # Every stage returns a new array, so the input never needs a copy
+        processed_audio = audio_data
+        
+        # Gain, echo and reverb are delay taps; they are collected and run
+        # together with distortion and clipping in a single fused pass.
+        # Stages that need the whole signal flush the pending taps first.
+        taps = {0: gain}
         
         # Apply effects in order
-        if gain != 1.0:
-            processed_audio = self.apply_gain(processed_audio, gain)
-        
         if echo > 0.0:
-            processed_audio = self.apply_echo(processed_audio, echo)
+            taps = self._combine_taps(taps, self._echo_taps(echo))
         
-        if lowpass:
-            processed_audio = self.apply_lowpass_filter(processed_audio)
+        if lowpass or highpass or robot:
+            processed_audio = self._apply_taps(processed_audio, taps)
+            taps = {0: 1.0}
         
-        if highpass:
+        if lowpass and highpass:
+            processed_audio = self.apply_bandpass_filter(processed_audio)
+        elif lowpass:
+            processed_audio = self.apply_lowpass_filter(processed_audio)
+        elif highpass:
             processed_audio = self.apply_highpass_filter(processed_audio)
         
         if robot:
             processed_audio = self.apply_robot_voice(processed_audio)
         
         if reverb:
-            processed_audio = self.apply_reverb(processed_audio)
+            taps = self._combine_taps(taps, self._reverb_taps())
+        
+        if pitch != 1.0 or chorus:
+            processed_audio = self._apply_taps(processed_audio, taps)
+            taps = {0: 1.0}
         
         if pitch != 1.0:
             processed_audio = self.apply_pitch_shift(processed_audio, pitch)
@@ -59,13 +188,169 @@ class DSPProcessor:
         if chorus:
             processed_audio = self.apply_chorus(processed_audio)
         
+        # Apply remaining taps and distortion, ensuring audio doesn't clip.
+        # Buffers produced by earlier stages can be overwritten in place.
+        return self._apply_taps(processed_audio, taps, distortion=distortion, clip=True,
+                                in_place=processed_audio is not audio_data)
+    
+    def _process_audio_torch(self, audio_data: np.ndarray, device: str, gain: float,
+                             echo: float, lowpass: bool, highpass: bool, robot: bool,
+                             reverb: bool, pitch: float, chorus: bool, distortion: float,
+                             sample_rate: int = 44100) -> np.ndarray:
+        """
+        Process audio with PyTorch/julius on the given device (see process_audio)
+        
+        Filters are julius windowed-sinc FIR filters rather than Butterworth
+        filters, and delay taps run as FFT convolutions. Pitch shifting uses
+        the CPU phase vocoder.
+        
+        Returns:
+            Processed audio data
+        """
+        import torch
+        import julius
+        
+        x = torch.as_tensor(audio_data, device=device)
+        
+        def apply_taps(x, taps):
+            if max(taps) == 0:
+                return x * taps[0]
+            
+            # Causal FIR: y[i] = sum(gain * x[i - delay])
+            kernel = torch.zeros(max(taps) + 1, device=x.device)
+            for delay, tap_gain in taps.items():
+                kernel[delay] += tap_gain
+            padded = torch.nn.functional.pad(x, (len(kernel) - 1, 0))
+            return julius.fft_conv1d(padded[None, None], kernel.flip(0)[None, None])[0, 0]
+        
+        taps = {0: gain}
+        if echo > 0.0:
+            taps = self._combine_taps(taps, self._echo_taps(echo))
+        x = apply_taps(x, taps)
+        
+        if lowpass:
+            x = julius.lowpass_filter(x, 1000.0 / sample_rate)
+        
+        if highpass:
+            x = julius.highpass_filter(x, 300.0 / sample_rate)
+        
+        if robot:
+            smoothed = julius.lowpass_filter(x.abs(), 800.0 / sample_rate)
+            carrier = self._get_robot_carrier(len(smoothed), sample_rate)
+            x = smoothed * torch.as_tensor(carrier, device=x.device)
+        
+        if reverb:
+            x = apply_taps(x, self._reverb_taps())
+        
+        if pitch != 1.0:
+            shifted = self.apply_pitch_shift(x.cpu().numpy(), pitch, sample_rate)
+            x = torch.as_tensor(shifted, device=x.device)
+        
+        if chorus and len(x) > 0:
+            # Modulated fractional delay line (see apply_chorus)
+            n = len(x)
+            sample_idx = torch.arange(n, device=x.device, dtype=torch.float64)
+            t = sample_idx / sample_rate
+            read_idx = sample_idx + 0.002 * sample_rate * torch.sin(2 * np.pi * 1.5 * t)
+            read_idx = read_idx.clamp(0, n - 1)
+            lo = read_idx.floor().long()
+            hi = (lo + 1).clamp(max=n - 1)
+            frac = (read_idx - lo).float()
+            x = x + 0.5 * (x[lo] * (1 - frac) + x[hi] * frac)
+        
         if distortion > 0.0:
-            processed_audio = self.apply_distortion(processed_audio, distortion)
+            # Soft clipping (see apply_distortion)
+            threshold = 1.0 - distortion
+            magnitude = x.abs()
+            soft = threshold + distortion * torch.tanh((magnitude - threshold) / distortion)
+            x = torch.where(magnitude > threshold, torch.sign(x) * soft, x)
         
         # Ensure audio doesn't clip
-        processed_audio = np.clip(processed_audio, -1.0, 1.0)
+        x = x.clamp(-1.0, 1.0)
+        
+        return x.cpu().numpy().astype(np.float32, copy=False)
+    
+    def _apply_taps(self, audio_data: np.ndarray, taps: dict,
+                    distortion: float = 0.0, clip: bool = False,
+                    in_place: bool = False) -> np.ndarray:
+        """
+        Run the fused tap/distortion/clip kernel
+        
+        Args:
+            audio_data: Input audio data
+            taps: Mapping of delay in samples to tap gain
+            distortion: Distortion amount (0.0 to 1.0)
+            clip: Clip the output to [-1.0, 1.0]
+            in_place: Allow overwriting audio_data when no tap is delayed
+            
+        Returns:
+            Processed audio data
+        """
+        tap_delays = np.fromiter(taps.keys(), dtype=np.int64, count=len(taps))
+        tap_gains = np.fromiter(taps.values(), dtype=np.float64, count=len(taps))
+        
+        # A delayed tap reads samples that would already be overwritten
+        if (in_place and not tap_delays.any() and audio_data.dtype == np.float32
+                and audio_data.flags.c_contiguous and audio_data.flags.writeable):
+            out = audio_data
+        else:
+            out = np.empty(len(audio_data), dtype=np.float32)
+        
+        return _fused_chain(audio_data, tap_delays, tap_gains, float(distortion), clip, out)
+    
+    def _combine_taps(self, taps: dict, other: dict) -> dict:
+        """
+        Combine two sets of delay taps as if applied one after another
+        
+        Args:
+            taps: Mapping of delay in samples to tap gain
+            other: Mapping of delay in samples to tap gain
+            
+        Returns:
+            Combined mapping of delay in samples to tap gain
+        """
+        combined = {}
+        for delay_a, gain_a in taps.items():
+            for delay_b, gain_b in other.items():
+                delay = delay_a + delay_b
+                combined[delay] = combined.get(delay, 0.0) + gain_a * gain_b
+        return combined
+    
+    def _echo_taps(self, echo_intensity: float, delay_samples: int = 8000,
+                   decay: float = 0.5) -> dict:
+        """
+        Get the delay taps of the echo effect (see apply_echo)
+        
+        Args:
+            echo_intensity: Echo intensity (0.0 to 1.0)
+            delay_samples: Delay in samples
+            decay: Echo decay factor
+            
+        Returns:
+            Mapping of delay in samples to tap gain
+        """
+        return {0: 1.0, delay_samples: decay * echo_intensity}
+    
+    def _reverb_taps(self, room_size: float = 0.8, damping: float = 0.5) -> dict:
+        """
+        Get the delay taps of the reverb effect (see apply_reverb)
+        
+        Args:
+            room_size: Room size (0.0 to 1.0)
+            damping: Damping factor (0.0 to 1.0)
+            
+        Returns:
+            Mapping of delay in samples to tap gain
+        """
+        taps = {0: 1.0}
+        if room_size == 0.0:
+            return taps
         
-        return processed_audio.astype(np.float32)
+        delays = [int(8000 * room_size), int(12000 * room_size), int(16000 * room_size)]
+        decays = [0.6 * damping, 0.4 * damping, 0.2 * damping]
+        for delay, decay in zip(delays, decays):
+            taps[delay] = taps.get(delay, 0.0) + decay
+        return taps
     
     def apply_gain(self, audio_data: np.ndarray, gain: float) -> np.ndarray:
         """
@@ -106,8 +391,67 @@ class DSPProcessor:
         
         return result
     
+    def _get_sos(self, order: int, cutoff_hz: float, sample_rate: int, btype: str) -> np.ndarray:
+        """
+        Get a Butterworth filter design, reusing a cached one if available
+        
+        Args:
+            order: Filter order
+            cutoff_hz: Cutoff frequency in Hz
+            sample_rate: Audio sample rate
+            btype: Filter type ('low' or 'high')
+            
+        Returns:
+            Second-order sections of the filter
+        """
+        key = (order, cutoff_hz, sample_rate, btype)
+        sos = self._filter_cache.get(key)
+        if sos is None:
+            nyquist = sample_rate / 2
+            normal_cutoff = cutoff_hz / nyquist
+            sos = butter(order, normal_cutoff, btype=btype, analog=False, output='sos')
+            sos = sos.astype(np.float32)
+            self._filter_cache[key] = sos
+        return sos
+    
+    def _run_filter(self, sos: np.ndarray, audio_data: np.ndarray,
+                    state_key: tuple, realtime: Optional[bool]) -> np.ndarray:
+        """
+        Apply a filter, either zero-phase or causally with persistent state
+        
+        Args:
+            sos: Second-order sections of the filter
+            audio_data: Input audio data
+            state_key: Key under which the realtime filter state is kept
+            realtime: Filter causally; None uses the processor default
+            
+        Returns:
+            Filtered audio data
+        """
+        if realtime is None:
+            realtime = self.realtime
+        
+        if not realtime:
+            return sosfiltfilt(sos, audio_data)
+        
+        if len(audio_data) == 0:
+            return audio_data
+        
+        # Continue from the previous chunk, or start at steady state
+        zi = self._filter_state.get(state_key)
+        if zi is None:
+            zi = (sosfilt_zi(sos) * audio_data[0]).astype(sos.dtype)
+        
+        filtered, self._filter_state[state_key] = sosfilt(sos, audio_data, zi=zi)
+        return filtered
+    
+    def reset_filter_state(self):
+        """Forget the realtime filter state, e.g. before a new stream"""
+        self._filter_state.clear()
+    
     def apply_lowpass_filter(self, audio_data: np.ndarray, 
-                           cutoff_freq: float = 1000.0, sample_rate: int = 44100) -> np.ndarray:
+                           cutoff_freq: float = 1000.0, sample_rate: int = 44100,
+                           realtime: Optional[bool] = None) -> np.ndarray:
         """
         Apply low-pass filter (muffle effect)
         
@@ -115,23 +459,22 @@ class DSPProcessor:
             audio_data: Input audio data
             cutoff_freq: Cutoff frequency in Hz
             sample_rate: Audio sample rate
+            realtime: Filter causally with persistent state (None = processor default)
             
         Returns:
             Filtered audio data
         """
         # Design Butterworth low-pass filter
-        nyquist = sample_rate / 2
-        normal_cutoff = cutoff_freq / nyquist
-        b, a= butter(4, normal_cutoff, btype='low', analog=False)
-        
+        sos = self._get_sos(4, cutoff_freq, sample_rate, 'low')
         
         # Apply filter
-        filtered = filtfilt(b, a, audio_data)
+        filtered = self._run_filter(sos, audio_data, ('lowpass', cutoff_freq, sample_rate), realtime)
         
-        return filtered.astype(np.float32)
+        return filtered.astype(np.float32, copy=False)
     
     def apply_highpass_filter(self, audio_data: np.ndarray, 
-                            cutoff_freq: float = 300.0, sample_rate: int = 44100) -> np.ndarray:
+                            cutoff_freq: float = 300.0, sample_rate: int = 44100,
+                            realtime: Optional[bool] = None) -> np.ndarray:
         """
         Apply high-pass filter (tinny/radio effect)
         
@@ -139,28 +482,61 @@ class DSPProcessor:
             audio_data: Input audio data
             cutoff_freq: Cutoff frequency in Hz
             sample_rate: Audio sample rate
+            realtime: Filter causally with persistent state (None = processor default)
             
         Returns:
             Filtered audio data
         """
         # Design Butterworth high-pass filter
-        nyquist = sample_rate / 2
-        normal_cutoff = cutoff_freq / nyquist
-        b, a = butter(4, normal_cutoff, btype='high', analog=False)
+        sos = self._get_sos(4, cutoff_freq, sample_rate, 'high')
         
         # Apply filter
-        filtered = filtfilt(b, a, audio_data)
+        filtered = self._run_filter(sos, audio_data, ('highpass', cutoff_freq, sample_rate), realtime)
         
-        return filtered.astype(np.float32)
+        return filtered.astype(np.float32, copy=False)
+    
+    def apply_bandpass_filter(self, audio_data: np.ndarray,
+                              low_cutoff: float = 300.0, high_cutoff: float = 1000.0,
+                              sample_rate: int = 44100,
+                              realtime: Optional[bool] = None) -> np.ndarray:
+        """
+        Apply high-pass and low-pass filters as one cascade (telephone effect)
+        
+        Equivalent to apply_highpass_filter followed by apply_lowpass_filter,
+        but runs a single forward-backward pass over the audio.
+        
+        Args:
+            audio_data: Input audio data
+            low_cutoff: High-pass cutoff frequency in Hz
+            high_cutoff: Low-pass cutoff frequency in Hz
+            sample_rate: Audio sample rate
+            realtime: Filter causally with persistent state (None = processor default)
+            
+        Returns:
+            Filtered audio data
+        """
+        # Stack the second-order sections of both Butterworth filters
+        sos = np.vstack([
+            self._get_sos(4, high_cutoff, sample_rate, 'low'),
+            self._get_sos(4, low_cutoff, sample_rate, 'high')
+        ])
+        
+        # Apply filter
+        filtered = self._run_filter(sos, audio_data,
+                                    ('bandpass', low_cutoff, high_cutoff, sample_rate), realtime)
+        
+        return filtered.astype(np.float32, copy=False)
     
     def apply_robot_voice(self, audio_data: np.ndarray, 
-                         sample_rate: int = 44100) -> np.ndarray:
+                         sample_rate: int = 44100,
+                         realtime: Optional[bool] = None) -> np.ndarray:
         """
         Apply robot voice effect (rectification + filtering)
         
         Args:
             audio_data: Input audio data
             sample_rate: Audio sample rate
+            realtime: Filter causally with persistent state (None = processor default)
             
         Returns:
             Audio data with robot effect
@@ -169,17 +545,35 @@ class DSPProcessor:
         rectified = np.abs(audio_data)
         
         # Apply low-pass filter to smooth the rectified signal
-        nyquist = sample_rate / 2
-        normal_cutoff = 800.0 / nyquist  # 800 Hz cutoff
-        b, a = butter(4, normal_cutoff, btype='low', analog=False)
+        sos = self._get_sos(4, 800.0, sample_rate, 'low')  # 800 Hz cutoff
         
-        smoothed = filtfilt(b, a, rectified)
+        smoothed = self._run_filter(sos, rectified, ('robot', sample_rate), realtime)
         
         # Add some harmonics for robotic sound
-        harmonics = np.sin(2 * np.pi * 50 * np.arange(len(smoothed)) / sample_rate)
-        result = smoothed + 0.3 * harmonics * smoothed
+        result = smoothed * self._get_robot_carrier(len(smoothed), sample_rate)
         
-        return result.astype(np.float32)
+        return result.astype(np.float32, copy=False)
+    
+    def _get_robot_carrier(self, length: int, sample_rate: int) -> np.ndarray:
+        """
+        Get the robot voice modulation envelope (1 + 0.3 * 50 Hz sine)
+        
+        The envelope for a shorter buffer is a prefix of a longer one, so only
+        the longest envelope per sample rate is kept.
+        
+        Args:
+            length: Number of samples
+            sample_rate: Audio sample rate
+            
+        Returns:
+            Modulation envelope of the given length
+        """
+        carrier = self._carrier_cache.get(sample_rate)
+        if carrier is None or len(carrier) < length:
+            harmonics = np.sin(2 * np.pi * 50 * np.arange(length) / sample_rate)
+            carrier = (1.0 + 0.3 * harmonics).astype(np.float32)
+            self._carrier_cache[sample_rate] = carrier
+        return carrier[:length]
     
     def apply_reverb(self, audio_data: np.ndarray, 
                     room_size: float = 0.8, damping: float = 0.5) -> np.ndarray:
@@ -197,24 +591,13 @@ class DSPProcessor:
         if room_size == 0.0:
             return audio_data
         
-        # Create multiple delayed echoes
-        delays = [int(8000 * room_size), int(12000 * room_size), int(16000 * room_size)]
-        decays = [0.6 * damping, 0.4 * damping, 0.2 * damping]
-        
-        result = audio_data.copy()
-        
-        for delay, decay in zip(delays, decays):
-            if delay < len(audio_data):
-                delayed = np.zeros_like(audio_data)
-                delayed[delay:] = audio_data[:-delay] * decay
-                result += delayed
-        
-        return result
+        # Sum all delayed echoes in a single pass
+        return self._apply_taps(audio_data, self._reverb_taps(room_size, damping))
     
     def apply_pitch_shift(self, audio_data: np.ndarray, 
                          pitch_factor: float, sample_rate: int = 44100) -> np.ndarray:
         """
-        Apply pitch shifting effect
+        Apply pitch shifting effect (phase vocoder, duration is preserved)
         
         Args:
             audio_data: Input audio data
@@ -224,14 +607,41 @@ class DSPProcessor:
         Returns:
             Pitch-shifted audio data
         """
+        # librosa is slow to import, so load it only when pitch shifting is used
+        import librosa
+        
         # Flatten to 1D
         audio_data = np.ravel(audio_data)
         
-        # Resample the audio
-        new_length = int(len(audio_data) / pitch_factor)
-        indices = np.linspace(0, len(audio_data) - 1, new_length)
+        # Time-stretch by the pitch factor with a phase vocoder
+        stft = librosa.stft(audio_data, n_fft=2048, hop_length=512)
+        stft = librosa.phase_vocoder(stft, rate=1.0 / pitch_factor, hop_length=512)
+        stretched = librosa.istft(stft, hop_length=512,
+                                  length=math.ceil(len(audio_data) * pitch_factor))
+        
+        # Resample back to the original duration, which shifts the pitch
+        return self._resample(stretched, pitch_factor, len(audio_data))
+    
+    def _resample(self, audio_data: np.ndarray, factor: float, new_length: int) -> np.ndarray:
+        """
+        Resample audio by a factor
+        
+        Args:
+            audio_data: Input audio data
+            factor: Resampling factor (2.0 = half as many samples)
+            new_length: Length of the resampled audio
+            
+        Returns:
+            Resampled audio data
+        """
+        # Polyphase resampling for factors that are (close to) a simple ratio
+        ratio = Fraction(factor).limit_denominator(100)
+        if abs(float(ratio) - factor) < 1e-6:
+            result = resample_poly(audio_data, ratio.denominator, ratio.numerator)
+            return result[:new_length].astype(np.float32, copy=False)
         
         # Linear interpolation
+        indices = np.linspace(0, len(audio_data) - 1, new_length)
         result = np.interp(indices, np.arange(len(audio_data)), audio_data)
         return result.astype(np.float32)
     
@@ -250,18 +660,18 @@ class DSPProcessor:
         Returns:
             Audio data with chorus effect
         """
-        # Create modulation signal
-        t = np.arange(len(audio_data)) / sample_rate
-        modulation = depth * np.sin(2 * np.pi * rate * t)
+        if len(audio_data) == 0:
+            return audio_data
         
-        # Create delayed version with modulation
-        max_delay = int(depth * sample_rate)
-        result = np.zeros_like(audio_data)
+        # Create modulated read positions (fractional delay line)
+        sample_idx = np.arange(len(audio_data))
+        t = sample_idx / sample_rate
+        read_idx = sample_idx + depth * sample_rate * np.sin(2 * np.pi * rate * t)
+        read_idx = np.clip(read_idx, 0, len(audio_data) - 1)
         
-        for i in range(len(audio_data)):
-            delay = int(modulation[i] * sample_rate)
-            if i + delay < len(audio_data):
-                result[i] = audio_data[i] + 0.5 * audio_data[i + delay]
+        # Linear interpolation of the delayed signal
+        delayed = np.interp(read_idx, sample_idx, audio_data).astype(np.float32)
+        result = audio_data + np.float32(0.5) * delayed
         
         return result
     
@@ -280,16 +690,8 @@ class DSPProcessor:
         if amount == 0.0:
             return audio_data
         
-        # Apply soft clipping
-        threshold = 1.0 - amount
-        result = np.where(
-            np.abs(audio_data) > threshold,
-            np.sign(audio_data) * (threshold + (1.0 - threshold) * 
-                                 np.tanh((np.abs(audio_data) - threshold) / (1.0 - threshold))),
-            audio_data
-        )
-        
-        return result
+        # Apply soft clipping in a single pass
+        return self._apply_taps(audio_data, {0: 1.0}, distortion=amount)
     
     def apply_compression(self, audio_data: np.ndarray, 
                          threshold: float = 0.5, ratio: float = 4.0) -> np.ndarray:
@@ -338,11 +740,17 @@ class DSPProcessor:
         Returns:
             Dictionary with audio statistics
         """
+        # _stats is compiled for writeable float arrays only
+        samples = np.ascontiguousarray(np.ravel(audio_data), dtype=np.float32)
+        if not samples.flags.writeable:
+            samples = samples.copy()
+        max_amplitude, mean, mean_square = _stats(samples)
+        
         return {
             'length': len(audio_data),
             'duration': len(audio_data) / 44100,  # Assuming 44.1kHz
-            'max_amplitude': np.max(np.abs(audio_data)),
-            'rms': np.sqrt(np.mean(audio_data**2)),
-            'mean': np.mean(audio_data),
-            'std': np.std(audio_data)
+            'max_amplitude': max_amplitude,
+            'rms': math.sqrt(mean_square),
+            'mean': mean,
+            'std': math.sqrt(max(mean_square - mean * mean, 0.0))
         } 
\ No newline at end of file
@@ -3,12 +3,25 @@ import numpy as np
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import os
+import shutil
+import tempfile
 import librosa
 
+# Multichannel files longer than this (in frames) are downmixed block by block
+STREAM_THRESHOLD_FRAMES = 2 ** 22
+
 class FileOperations:
-    def __init__(self):
-        """Initialize the file operations handler"""
+    def __init__(self, headless: bool = False):
+        """
+        Initialize the file operations handler
+        
+        Args:
+            headless: If True, never open dialogs or message boxes; errors are
+                raised and notices are printed instead (for batch/worker use)
+        """
+        self.headless = headless
         self.supported_formats = {
             'WAV': '*.wav',
             'FLAC': '*.flac',
@@ -17,10 +30,32 @@ class FileOperations:
             'MP3': '*.mp3',
             'All Audio Files': '*.wav;*.flac;*.ogg;*.aiff;*.mp3'
         }
+        self._valid_suffixes = ('.wav', '.flac', '.ogg', '.aiff', '.mp3')
+        
+        # Hidden root window for file dialogs, created on first use
+        self._root = None
+    
+    @property
+    def _dialog_root(self) -> tk.Tk:
+        """Hidden Tk root used as the parent of file dialogs, created lazily"""
+        if self._root is None:
+            self._root = tk.Tk()
+            self._root.withdraw()  # Hide the root window
+        return self._root
+    
+    def _notify(self, kind: str, title: str, message: str):
+        """
+        Show a message box, or print the message when running headless
         
-        # Create root window for file dialogs (hidden)
-        self.root = tk.Tk()
-        self.root.withdraw()  # Hide the root window
+        Args:
+            kind: Message box type ("info", "warning" or "error")
+            title: Message title
+            message: Message text
+        """
+        if self.headless:
+            print(f"{title}: {message}")
+        else:
+            getattr(messagebox, f"show{kind}")(title, message)
     
     def import_audio(self) -> Tuple[Optional[np.ndarray], Optional[int]]:
         """
@@ -30,8 +65,12 @@ class FileOperations:
             Tuple of (audio_data, sample_rate) or (None, None) if cancelled
         """
         try:
+            if self.headless:
+                raise RuntimeError("File dialogs are not available in headless mode")
+            
             # Create file dialog
             file_path = filedialog.askopenfilename(
+                parent=self._dialog_root,
                 title="Import Audio File",
                 filetypes=[
                     ("WAV files", "*.wav"),
@@ -53,21 +92,13 @@ class FileOperations:
                 audio_data, sample_rate = librosa.load(file_path, sr=None, mono=True)
                 sample_rate = int(sample_rate)
             else:
-                # Use soundfile for other formats
-                audio_data, sample_rate = sf.read(file_path)
+                # Use soundfile for other formats, decoding straight to
+                # float32 in the range -1.0 to 1.0
+                audio_data, sample_rate = sf.read(file_path, dtype='float32', always_2d=False)
                 
                 # Convert to mono if stereo
                 if len(audio_data.shape) > 1:
-                    audio_data = np.mean(audio_data, axis=1)
-                
-                # Normalize to float32 range (-1.0 to 1.0)
-                if audio_data.dtype != np.float32:
-                    if audio_data.dtype == np.int16:
-                        audio_data = audio_data.astype(np.float32) / 32768.0
-                    elif audio_data.dtype == np.int32:
-                        audio_data = audio_data.astype(np.float32) / 2147483648.0
-                    else:
-                        audio_data = audio_data.astype(np.float32)
+                    audio_data = self._to_mono(audio_data)
             
             print(f"Imported: {os.path.basename(file_path)}")
             print(f"Sample rate: {sample_rate} Hz")
@@ -76,9 +107,26 @@ class FileOperations:
             return audio_data, sample_rate
             
         except Exception as e:
-            messagebox.showerror("Import Error", f"Failed to import audio file:\n{str(e)}")
+            if self.headless:
+                raise
+            self._notify("error", "Import Error", f"Failed to import audio file:\n{str(e)}")
             return None, None
     
+    def _to_mono(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Downmix multichannel audio to mono in a single float32 pass
+        
+        Args:
+            audio_data: Audio data with shape (frames, channels)
+            
+        Returns:
+            Mono float32 audio data
+        """
+        audio_data = audio_data.astype(np.float32, copy=False)
+        if audio_data.shape[1] == 2:
+            return (audio_data[:, 0] + audio_data[:, 1]) * np.float32(0.5)
+        return audio_data.mean(axis=1, dtype=np.float32)
+    
     def export_audio(self, audio_data: np.ndarray, sample_rate: int, 
                     filename: Optional[str] = None, format: str = "WAV") -> bool:
         """
@@ -95,6 +143,9 @@ class FileOperations:
         """
         try:
             if filename is None:
+                if self.headless:
+                    raise RuntimeError("A filename is required in headless mode")
+                
                 # Set default extension based on format
                 format_extensions = {
                     "WAV": ".wav",
@@ -123,6 +174,7 @@ class FileOperations:
                 
                 # Create file dialog for export
                 filename = filedialog.asksaveasfilename(
+                    parent=self._dialog_root,
                     title=f"Export Audio File as {format}",
                     defaultextension=default_ext,
                     filetypes=filetypes
@@ -154,11 +206,13 @@ class FileOperations:
             print(f"Sample rate: {sample_rate} Hz")
             print(f"Duration: {len(audio_data) / sample_rate:.2f} seconds")
             
-            messagebox.showinfo("Export Success", f"Audio exported successfully to:\n{filename}")
+            self._notify("info", "Export Success", f"Audio exported successfully to:\n{filename}")
             return True
             
         except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export audio file:\n{str(e)}")
+            if self.headless:
+                raise
+            self._notify("error", "Export Error", f"Failed to export audio file:\n{str(e)}")
             return False
     
     def _export_mp3(self, audio_data: np.ndarray, sample_rate: int, filename: str):
@@ -226,7 +280,8 @@ class FileOperations:
                 except (ImportError, FileNotFoundError, Exception):
                     # Final fallback: Save as WAV with MP3 extension and warn user
                     sf.write(filename, audio_data, sample_rate)
-                    messagebox.showwarning(
+                    self._notify(
+                        "warning",
                         "MP3 Export Warning",
                         "MP3 export libraries not available. "
                         "File saved as WAV format with .mp3 extension.\n\n"
@@ -280,32 +335,20 @@ class FileOperations:
         Returns:
             List of tuples (file_path, audio_data, sample_rate)
         """
-        imported_files = []
-        
         try:
-            for filename in os.listdir(directory):
-                file_path = os.path.join(directory, filename)
-                
-                # Check if file is supported
-                if any(filename.lower().endswith(ext.replace('*', '')) 
-                      for ext in self.supported_formats.values()):
-                    
-                    try:
-                        audio_data, sample_rate = sf.read(file_path)
-                        
-                        # Convert to mono if stereo
-                        if len(audio_data.shape) > 1:
-                            audio_data = np.mean(audio_data, axis=1)
-                        
-                        # Normalize
-                        if audio_data.dtype != np.float32:
-                            audio_data = audio_data.astype(np.float32)
-                        
-                        imported_files.append((file_path, audio_data, sample_rate))
-                        print(f"Batch imported: {filename}")
-                        
-                    except Exception as e:
-                        print(f"Failed to import {filename}: {e}")
+            file_paths = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Check if file is supported
+                    if entry.name.lower().endswith(self._valid_suffixes) and entry.is_file():
+                        file_paths.append(entry.path)
+            
+            # Decode files in parallel (libsndfile releases the GIL)
+            max_workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._load_one, file_paths))
+            
+            imported_files = [result for result in results if result is not None]
             
             print(f"Batch import completed: {len(imported_files)} files imported")
             return imported_files
@@ -314,6 +357,44 @@ class FileOperations:
             print(f"Batch import error: {e}")
             return []
     
+    def _load_one(self, file_path: str) -> Optional[Tuple[str, np.ndarray, int]]:
+        """
+        Load a single audio file for batch import
+        
+        Args:
+            file_path: Path to the audio file
+            
+        Returns:
+            Tuple of (file_path, audio_data, sample_rate) or None if error
+        """
+        filename = os.path.basename(file_path)
+        
+        try:
+            with sf.SoundFile(file_path) as f:
+                sample_rate = f.samplerate
+                
+                if f.channels > 1 and f.frames > STREAM_THRESHOLD_FRAMES:
+                    # Downmix block by block instead of loading all channels
+                    audio_data = np.empty(f.frames, dtype=np.float32)
+                    pos = 0
+                    for block in f.blocks(blocksize=2 ** 16, dtype='float32'):
+                        audio_data[pos:pos + len(block)] = self._to_mono(block)
+                        pos += len(block)
+                    audio_data = audio_data[:pos]
+                else:
+                    audio_data = f.read(dtype='float32', always_2d=False)
+                    
+                    # Convert to mono if stereo
+                    if len(audio_data.shape) > 1:
+                        audio_data = self._to_mono(audio_data)
+            
+            print(f"Batch imported: {filename}")
+            return file_path, audio_data, sample_rate
+            
+        except Exception as e:
+            print(f"Failed to import {filename}: {e}")
+            return None
+    
     def save_preset(self, preset_name: str, preset_config: dict, 
                    filename: Optional[str] = None) -> bool:
         """
@@ -401,28 +482,59 @@ class FileOperations:
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = None
         try:
-            # Read audio file
-            audio_data, sample_rate = sf.read(input_path)
-            
-            # Convert to mono if stereo
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
-            
-            # Normalize
-            max_val = np.max(np.abs(audio_data))
-            if max_val > 0:
-                audio_data = audio_data / max_val
-            
-            # Write normalized file
-            sf.write(output_path, audio_data, sample_rate)
-            
+            # Stream the file twice (peak, then scale and write) so only one
+            # block is in memory at a time
+            blocksize = 2 ** 16
+            
+            # Write to a temporary file next to the output and move it into place
+            # afterwards, so normalizing a file in place never truncates the input
+            out_dir = os.path.dirname(os.path.abspath(output_path))
+            fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(output_path)[1], dir=out_dir)
+            os.close(fd)
+            
+            with sf.SoundFile(input_path) as f:
+                sample_rate = f.samplerate
+                
+                # First pass: find the peak of the mono mix
+                max_val = 0.0
+                for block in f.blocks(blocksize=blocksize, dtype='float32'):
+                    # Convert to mono if stereo
+                    if len(block.shape) > 1:
+                        block = self._to_mono(block)
+                    if len(block):
+                        max_val = max(max_val, float(np.max(np.abs(block))))
+                
+                scale = np.float32(1.0 / max_val) if max_val > 0 else np.float32(1.0)
+                
+                # Second pass: normalize and write normalized file
+                f.seek(0)
+                with sf.SoundFile(tmp_path, 'w', samplerate=sample_rate, channels=1) as out:
+                    for block in f.blocks(blocksize=blocksize, dtype='float32'):
+                        if len(block.shape) > 1:
+                            block = self._to_mono(block)
+                        out.write(block * scale)
+            
+            # mkstemp creates the file 0600; give it the mode a plain write would
+            if os.path.exists(output_path):
+                shutil.copymode(output_path, tmp_path)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, output_path)
+            tmp_path = None
             print(f"Normalized: {os.path.basename(input_path)} -> {os.path.basename(output_path)}")
             return True
             
         except Exception as e:
             print(f"Error normalizing audio: {e}")
             return False
+        
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
     def get_supported_formats(self) -> dict:
         """
@@ -435,7 +547,10 @@ class FileOperations:
     
     def cleanup(self):
         """Clean up resources"""
+        if self._root is None:
+            return
         try:
-            self.root.destroy()
+            self._root.destroy()
         except:
-            pass
\ No newline at end of file
+            pass
+        self._root = None
\ No newline at end of file
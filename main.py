@@ -9,6 +9,7 @@ from fileops import FileOperations
 import os
 from tkinter import filedialog, messagebox
 import numpy as np
+import soundfile as sf
 
 class VoiceChangerApp:
     def __init__(self):
@@ -36,7 +37,8 @@ class VoiceChangerApp:
         # --- End scrollable setup ---
         
         # Initialize components
-        self.audio_queue = queue.Queue()
+        # Lock-light C queue for the recorder -> processor handoff
+        self.audio_queue = queue.SimpleQueue()
         self.recorder = AudioRecorder(self.audio_queue)
         self.visualizer = AudioVisualizer()
         self.dsp = DSPProcessor()
@@ -50,12 +52,39 @@ class VoiceChangerApp:
         self.processed_audio = None
         self.sample_rate = 44100  # Default sample rate
         
+        # Pending debounced process_audio job (root.after id)
+        self._pending_process = None
+        
+        # Last (params key, source array, result) produced by process_audio
+        self._last_params = None
+        
+        # Last (source array, mono float32 array) passed to the visualizer
+        self._vis_cache = (None, None)
+        self._vis_scratch = None
+        
         # Create GUI
         self.create_widgets()
+        self.save_current_effects_state()
+        
+        # Widgets toggled together by set_button_states, plus the last
+        # options applied to each widget so unchanged ones are skipped
+        self._effect_widgets = [
+            self.gain_slider, self.echo_slider, self.pitch_slider, self.distortion_slider,
+            self.lowpass_check, self.highpass_check, self.robot_check, self.reverb_check, self.chorus_check,
+            self.preset_menu
+        ]
+        self._last_effect_state = None
+        self._widget_options = {}
         
         # Start audio processing thread
+        self._stop_event = threading.Event()
         self.audio_thread = threading.Thread(target=self.audio_processing_loop, daemon=True)
         self.audio_thread.start()
+        
+        # Start DSP worker thread; only the newest request is kept
+        self.dsp_request_q = queue.Queue(maxsize=1)
+        self.dsp_thread = threading.Thread(target=self.dsp_worker_loop, daemon=True)
+        self.dsp_thread.start()
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -179,7 +208,11 @@ class VoiceChangerApp:
         self.input_label = ctk.CTkLabel(input_frame, text="Input: ", font=ctk.CTkFont(size=16))
         self.input_label.pack(side='left',padx=(0,5))
         # idk happening but it works :D
-        input_device, output_device = self.recorder.get_devices()
+        # Devices are enumerated once here and cached for update_device
+        self._input_devices, self._output_devices = self.recorder.get_devices()
+        self._name_to_input_id = {name: i for i, name in self._input_devices}
+        self._name_to_output_id = {name: i for i, name in self._output_devices}
+        input_device, output_device = self._input_devices, self._output_devices
         input_text = [i[1] for i in input_device]
         output_text = [i[1] for i in output_device]
         # ---------------
@@ -221,83 +254,32 @@ class VoiceChangerApp:
         self.effects_label = ctk.CTkLabel(self.effects_frame, text="DSP Effects", font=ctk.CTkFont(size=16))
         self.effects_label.pack(pady=(0, 10))
         
-        # Gain control
-        gain_frame = ctk.CTkFrame(self.effects_frame)
-        gain_frame.pack(fill="x", padx=10, pady=5)
-        
-        self.gain_label = ctk.CTkLabel(gain_frame, text="Gain:")
-        self.gain_label.pack(side="left", padx=(10, 5))
-        
-        self.gain_slider = ctk.CTkSlider(
-            gain_frame, 
-            from_=1, 
-            to=30, 
-            number_of_steps=29,
-            command=lambda v: self.update_gain(v/10)
-        )
-        self.gain_slider.pack(side="left", fill="x", expand=True, padx=5)
-        self.gain_slider.set(10)  # Default to 1.0
-        
-        self.gain_value = ctk.CTkLabel(gain_frame, text="1.0x")
-        self.gain_value.pack(side="right", padx=(5, 10))
-        
-        # Echo control
-        echo_frame = ctk.CTkFrame(self.effects_frame)
-        echo_frame.pack(fill="x", padx=10, pady=5)
-        
-        self.echo_label = ctk.CTkLabel(echo_frame, text="Echo:")
-        self.echo_label.pack(side="left", padx=(10, 5))
-        
-        self.echo_slider = ctk.CTkSlider(
-            echo_frame, 
-            from_=0, 
-            to=8, 
-            number_of_steps=8,
-            command=lambda v: self.update_echo(v/10)
-        )
-        self.echo_slider.pack(side="left", fill="x", expand=True, padx=5)
-        
-        self.echo_value = ctk.CTkLabel(echo_frame, text="0.0")
-        self.echo_value.pack(side="right", padx=(5, 10))
-        
-        # Pitch shift
-        pitch_frame = ctk.CTkFrame(self.effects_frame)
-        pitch_frame.pack(fill="x", padx=10, pady=5)
-        
-        self.pitch_label = ctk.CTkLabel(pitch_frame, text="Pitch Shift:")
-        self.pitch_label.pack(side="left", padx=(10, 5))
-        
-        self.pitch_slider = ctk.CTkSlider(
-            pitch_frame,
-            from_=5,
-            to=20,
-            number_of_steps=15,
-            command=lambda v: self.update_pitch(v/10)
-        )
-        self.pitch_slider.pack(side="left", fill="x", expand=True, padx=5)
-        self.pitch_slider.set(10)  # Default to 1.0
-        
-        self.pitch_value = ctk.CTkLabel(pitch_frame, text="1.0x")
-        self.pitch_value.pack(side="right", padx=(5, 10))
-        
-        # Distortion control
-        distortion_frame = ctk.CTkFrame(self.effects_frame)
-        distortion_frame.pack(fill="x", padx=10, pady=5)
-        
-        self.distortion_label = ctk.CTkLabel(distortion_frame, text="Distortion:")
-        self.distortion_label.pack(side="left", padx=(10, 5))
-        
-        self.distortion_slider = ctk.CTkSlider(
-            distortion_frame,
-            from_=0,
-            to=10,
-            number_of_steps=10,
-            command=lambda v: self.update_distortion(v/10)
-        )
-        self.distortion_slider.pack(side="left", fill="x", expand=True, padx=5)
-        
-        self.distortion_value = ctk.CTkLabel(distortion_frame, text="0.0")
-        self.distortion_value.pack(side="right", padx=(5, 10))
+        # Effect sliders: (attr, label, from, to, steps, default position, value format)
+        for attr, label, lo, hi, steps, default, fmt in [
+            ('gain', 'Gain:', 1, 30, 29, 10, '{:.1f}x'),
+            ('echo', 'Echo:', 0, 8, 8, 0, '{:.1f}'),
+            ('pitch', 'Pitch Shift:', 5, 20, 15, 10, '{:.1f}x'),
+            ('distortion', 'Distortion:', 0, 10, 10, 0, '{:.1f}'),
+        ]:
+            frame = ctk.CTkFrame(self.effects_frame)
+            frame.pack(fill="x", padx=10, pady=5)
+            
+            name_label = ctk.CTkLabel(frame, text=label)
+            name_label.pack(side="left", padx=(10, 5))
+            
+            slider = ctk.CTkSlider(frame, from_=lo, to=hi, number_of_steps=steps)
+            slider.pack(side="left", fill="x", expand=True, padx=5)
+            slider.set(default)
+            
+            value_label = ctk.CTkLabel(frame, text=fmt.format(default / 10))
+            value_label.pack(side="right", padx=(5, 10))
+            slider.configure(
+                command=lambda v, w=value_label, f=fmt: self._on_effect_change(w, f, v/10)
+            )
+            
+            setattr(self, f'{attr}_label', name_label)
+            setattr(self, f'{attr}_slider', slider)
+            setattr(self, f'{attr}_value', value_label)
         
         # Right panel - Presets and Filters
         right_panel = ctk.CTkFrame(control_panels)
@@ -332,99 +314,130 @@ class VoiceChangerApp:
         filter_checks_frame = ctk.CTkFrame(self.filter_frame)
         filter_checks_frame.pack(pady=5)
         
-        self.lowpass_var = ctk.BooleanVar()
-        self.lowpass_check = ctk.CTkCheckBox(
-            filter_checks_frame, 
-            text="Low-Pass", 
-            variable=self.lowpass_var,
-            command=self.update_filters
-        )
-        self.lowpass_check.pack(side="left", padx=10)
-        
-        self.highpass_var = ctk.BooleanVar()
-        self.highpass_check = ctk.CTkCheckBox(
-            filter_checks_frame, 
-            text="High-Pass", 
-            variable=self.highpass_var,
-            command=self.update_filters
-        )
-        self.highpass_check.pack(side="left", padx=10)
-        
-        self.robot_var = ctk.BooleanVar()
-        self.robot_check = ctk.CTkCheckBox(
-            filter_checks_frame, 
-            text="Robot Voice", 
-            variable=self.robot_var,
-            command=self.update_filters
-        )
-        self.robot_check.pack(side="left", padx=10)
-        
-        self.reverb_var = ctk.BooleanVar()
-        self.reverb_check = ctk.CTkCheckBox(
-            filter_checks_frame, 
-            text="Reverb", 
-            variable=self.reverb_var,
-            command=self.update_filters
-        )
-        self.reverb_check.pack(side="left", padx=10)
-        
-        self.chorus_var = ctk.BooleanVar()
-        self.chorus_check = ctk.CTkCheckBox(
-            filter_checks_frame,
-            text="Chorus",
-            variable=self.chorus_var,
-            command=self.update_filters
-        )
-        self.chorus_check.pack(side="left", padx=10)
+        for attr, label in [('lowpass', 'Low-Pass'), ('highpass', 'High-Pass'),
+                            ('robot', 'Robot Voice'), ('reverb', 'Reverb'), ('chorus', 'Chorus')]:
+            var = ctk.BooleanVar()
+            check = ctk.CTkCheckBox(
+                filter_checks_frame,
+                text=label,
+                variable=var,
+                command=self.update_filters
+            )
+            check.pack(side="left", padx=10)
+            setattr(self, f'{attr}_var', var)
+            setattr(self, f'{attr}_check', check)
+        
+        # Preset key -> widget bindings used by apply_preset
+        self._preset_bindings = [
+            (self.gain_slider, self.gain_value, 'gain', 1.0, 10, '{:.1f}x'),
+            (self.echo_slider, self.echo_value, 'echo', 0.0, 10, '{:.1f}'),
+            (self.pitch_slider, self.pitch_value, 'pitch_shift', 1.0, 10, '{:.1f}x'),
+            (self.distortion_slider, self.distortion_value, 'distortion', 0.0, 10, '{:.1f}'),
+        ]
+        self._preset_flags = [
+            (self.lowpass_var, 'lowpass'),
+            (self.highpass_var, 'highpass'),
+            (self.robot_var, 'robot'),
+            (self.reverb_var, 'reverb'),
+            (self.chorus_var, 'chorus'),
+        ]
     
     def create_visualizer_canvas(self):
-        # Clear existing canvas if it exists
-        if hasattr(self, 'visualizer_canvas') and self.visualizer_canvas is not None:
-            self.visualizer_canvas.destroy()
+        # The canvas is created once and updated in place afterwards
+        if self.visualizer_canvas is not None:
+            return
         
-        # Create new canvas
         self.visualizer_canvas = self.visualizer.create_canvas(self.visualizer_frame)
         self.visualizer_canvas.pack(fill="both", expand=True, padx=10, pady=10)
 
     def update_visualizer(self, audio, sample_rate):
         if audio is not None and sample_rate is not None:
-            # Ensure audio is in correct format
-            audio = np.asarray(audio, dtype=np.float32)
-            if len(audio.shape) > 1:
-                audio = np.mean(audio, axis=1)  # Convert to mono if stereo
+            source, mono = self._vis_cache
+            if source is not audio:
+                mono = self._to_visual_mono(audio)
+                # Holding the source keeps its id from being reused
+                self._vis_cache = (audio, mono)
+            audio = mono
+            
+            # Reduce to a min/max envelope of about two values per pixel
+            w = max(self.visualizer_canvas.winfo_width(), 512)
+            if len(audio) >= 2 * w:
+                audio, sample_rate = self._minmax_envelope(audio, sample_rate, w)
+                if self.visualizer.max_points < len(audio):
+                    self.visualizer.set_max_points(len(audio))
                 
-            self.create_visualizer_canvas()
-            self.visualizer.update_waveform(audio, sample_rate)
+            self.visualizer.redraw(audio, sample_rate)
+
+    def _minmax_envelope(self, audio, sample_rate, width):
+        """
+        Downsample audio to interleaved per-column minima and maxima
+
+        Args:
+            audio: Mono float32 audio data
+            sample_rate: Sample rate of the audio
+            width: Number of columns
+
+        Returns:
+            Tuple of (envelope, effective sample rate of the envelope)
+        """
+        block = max(1, len(audio) // width)
+        blocks = audio[:block * width].reshape(width, block)
+        envelope = np.stack([blocks.min(axis=1), blocks.max(axis=1)], axis=1).ravel()
+        return envelope, 2 * sample_rate / block
+
+    def _to_visual_mono(self, audio, use_scratch=True):
+        """Convert audio to mono float32, copying only when needed"""
+        audio = np.asarray(audio)
+        if audio.ndim == 1:
+            return np.ascontiguousarray(audio, dtype=np.float32)
+        if not use_scratch:
+            return audio.mean(axis=1, dtype=np.float32)
+        
+        # Convert to mono if stereo, reusing the scratch buffer
+        n = audio.shape[0]
+        if self._vis_scratch is None or len(self._vis_scratch) < n:
+            self._vis_scratch = np.empty(n, dtype=np.float32)
+        mono = self._vis_scratch[:n]
+        np.mean(audio, axis=1, dtype=np.float32, out=mono)
+        return mono
 
     def set_button_states(self, *, recording=False, playing=False, paused=False, can_play=False):
         # Default: only record enabled
         if recording:
-            self.record_button.configure(text="⏹️ Stop", state="normal", fg_color="gray", hover_color="darkgray")
-            self.pause_button.configure(state="normal")
-            self.resume_button.configure(state="disabled")
-            self.play_button.configure(state="disabled", text="▶️ Play")
+            self._configure(self.record_button, text="⏹️ Stop", state="normal", fg_color="gray", hover_color="darkgray")
+            self._configure(self.pause_button, state="normal")
+            self._configure(self.resume_button, state="disabled")
+            self._configure(self.play_button, state="disabled", text="▶️ Play")
         elif playing:
-            self.record_button.configure(state="disabled", text="🎤 Record", fg_color="red", hover_color="darkred")
-            self.pause_button.configure(state="normal")
-            self.resume_button.configure(state="disabled")
-            self.play_button.configure(text="⏹️ Stop", state="normal")
+            self._configure(self.record_button, state="disabled", text="🎤 Record", fg_color="red", hover_color="darkred")
+            self._configure(self.pause_button, state="normal")
+            self._configure(self.resume_button, state="disabled")
+            self._configure(self.play_button, text="⏹️ Stop", state="normal")
         elif paused:
-            self.pause_button.configure(state="disabled")
-            self.resume_button.configure(state="normal")
+            self._configure(self.pause_button, state="disabled")
+            self._configure(self.resume_button, state="normal")
         else:
-            self.record_button.configure(state="normal", text="🎤 Record", fg_color="red", hover_color="darkred")
-            self.pause_button.configure(state="disabled")
-            self.resume_button.configure(state="disabled")
+            self._configure(self.record_button, state="normal", text="🎤 Record", fg_color="red", hover_color="darkred")
+            self._configure(self.pause_button, state="disabled")
+            self._configure(self.resume_button, state="disabled")
             if can_play:
-                self.play_button.configure(state="normal", text="▶️ Play")
+                self._configure(self.play_button, state="normal", text="▶️ Play")
             else:
-                self.play_button.configure(state="disabled", text="▶️ Play")
+                self._configure(self.play_button, state="disabled", text="▶️ Play")
         # Effects and presets only enabled if not recording or playing
         effect_state = "normal" if not (recording or playing) else "disabled"
-        for w in [self.gain_slider, self.echo_slider, self.pitch_slider, self.distortion_slider,
-                  self.lowpass_check, self.highpass_check, self.robot_check, self.reverb_check, self.chorus_check,
-                  self.preset_menu]:
-            w.configure(state=effect_state)
+        if effect_state != self._last_effect_state:
+            for w in self._effect_widgets:
+                w.configure(state=effect_state)
+            self._last_effect_state = effect_state
+
+    def _configure(self, widget, **options):
+        """Configure only the options that differ from the last applied values"""
+        applied = self._widget_options.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if applied.get(k) != v}
+        if changed:
+            widget.configure(**changed)
+            applied.update(changed)
 
     def toggle_recording(self):
         if not getattr(self, 'is_recording', False):
@@ -450,37 +463,34 @@ class VoiceChangerApp:
         if self.processed_audio is not None and self.sample_rate is not None:
             self.update_visualizer(self.processed_audio, self.sample_rate)
         
-    def check_playback_status(self):
-        if not self.recorder.is_playing and self.is_playing:
-            self.is_playing = False
-            self.set_button_states(can_play=self.processed_audio is not None)
-        elif self.is_playing:
-            self.root.after(100, self.check_playback_status)
-
     def play_audio(self):
         if self.processed_audio is not None:
             if not self.is_playing:
+                # The recorder reports end of stream from the audio thread
+                self.recorder.on_finished = lambda: self.root.after(0, self._playback_done)
                 self.recorder.play_audio(self.processed_audio)
                 self.is_playing = True
                 self.is_recording = False
                 self.set_button_states(playing=True)
-                self.root.after(100, self.check_playback_status)
             else:
                 self.stop_audio()
     
     def stop_audio(self):
+        # Detach the callback first: the Tk thread blocks in stop_playback, so the
+        # audio thread must not wait on it
+        self.recorder.on_finished = None
         self.recorder.stop_playback()
         self.is_playing = False
         self.set_button_states(can_play=self.processed_audio is not None)
         self.play_button.configure(command=self.play_audio)
     
-    def poll_playback_end(self):
-        if not self.recorder.get_playback_status():
-            self.is_playing = False
-            self.set_button_states(can_play=self.processed_audio is not None)
-            self.play_button.configure(command=self.play_audio)
-        else:
-            self.root.after(100, self.poll_playback_end)
+    def _playback_done(self):
+        """Reset the playback UI once the output stream has finished"""
+        if not self.is_playing:
+            return
+        self.is_playing = False
+        self.set_button_states(can_play=self.processed_audio is not None)
+        self.play_button.configure(command=self.play_audio)
     
     def pause_action(self):
         if self.is_recording:
@@ -500,8 +510,6 @@ class VoiceChangerApp:
     
     def import_audio(self):
         try:
-            import os
-            from tkinter import filedialog, messagebox
             file_path = filedialog.askopenfilename(
                 title="Import Audio File",
                 filetypes=[
@@ -512,31 +520,29 @@ class VoiceChangerApp:
             )
             if not file_path:
                 return
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext == '.mp3':
+            try:
+                # libsndfile >= 1.1 (soundfile >= 0.12) decodes MP3 as well
+                audio_data, sample_rate = sf.read(file_path, dtype='float32', always_2d=False)
+            except Exception as e:
+                # Fall back to librosa/audioread for formats libsndfile can't read
                 try:
                     import librosa
                     audio_data, sample_rate = librosa.load(file_path, sr=None, mono=True)
                     sample_rate = int(sample_rate)
-                except Exception as e:
-                    messagebox.showerror("MP3 Import Error", f"Failed to import MP3 file.\nMake sure librosa and ffmpeg are installed.\nError: {str(e)}")
-                    return
-            else:
-                try:
-                    import soundfile as sf
-                    audio_data, sample_rate = sf.read(file_path)
-                    if len(audio_data.shape) > 1:
-                        audio_data = audio_data.mean(axis=1)
-                    if audio_data.dtype != float:
-                        audio_data = audio_data.astype('float32')
-                except Exception as e:
+                except Exception:
                     messagebox.showerror("Import Error", f"Failed to import audio file.\nError: {str(e)}")
                     return
+            # Downmix and convert to float32 in a single pass
+            if audio_data.ndim > 1:
+                mono = np.empty(audio_data.shape[0], dtype=np.float32)
+                np.mean(audio_data, axis=1, dtype=np.float32, out=mono)
+                audio_data = mono
+            else:
+                audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
             self.current_audio = audio_data
             self.sample_rate = sample_rate
-            self.process_audio()
-            self.update_visualizer(self.processed_audio, self.sample_rate)
-            self.set_button_states(can_play=True)
+            self.processed_audio = None
+            self._post_params()
         except Exception as e:
             print(f"Import error: {str(e)}")
     
@@ -544,8 +550,6 @@ class VoiceChangerApp:
         """Export processed audio to file"""
         if self.processed_audio is not None:
             try:
-                import os
-                from tkinter import filedialog, messagebox
                 file_path = filedialog.asksaveasfilename(
                     title="Export Audio File",
                     defaultextension=".mp3",
@@ -567,29 +571,25 @@ class VoiceChangerApp:
             except Exception as e:
                 print(f"Export error: {str(e)}")
     
-    def update_gain(self, value):
-        self.gain_value.configure(text=f"{value:.1f}x")
+    def _on_effect_change(self, label_widget, fmt, value):
+        """Update a slider's value label and schedule reprocessing"""
+        label_widget.configure(text=fmt.format(value))
         self.save_current_effects_state()
-        self.process_audio()
+        self._schedule_process()
 
-    def update_echo(self, value):
-        self.echo_value.configure(text=f"{value:.1f}")
+    def update_filters(self):
         self.save_current_effects_state()
-        self.process_audio()
+        self._schedule_process()
 
-    def update_pitch(self, value):
-        self.pitch_value.configure(text=f"{value:.1f}x")
-        self.save_current_effects_state()
-        self.process_audio()
+    def _schedule_process(self):
+        """Debounce processing so a burst of changes runs the DSP chain once"""
+        if self._pending_process:
+            self.root.after_cancel(self._pending_process)
+        self._pending_process = self.root.after(80, self._run_process)
 
-    def update_distortion(self, value):
-        self.distortion_value.configure(text=f"{value:.1f}")
-        self.save_current_effects_state()
-        self.process_audio()
-
-    def update_filters(self):
-        self.save_current_effects_state()
-        self.process_audio()
+    def _run_process(self):
+        self._pending_process = None
+        self._post_params()
     
     def apply_preset(self, preset_name=None):
         """Apply a preset configuration"""
@@ -598,33 +598,24 @@ class VoiceChangerApp:
         if preset_name != "None":
             preset_config = self.presets.get_preset(preset_name)
             if preset_config:
-                # Apply preset settings to UI
-                self.gain_slider.set(preset_config.get('gain', 1.0) * 10)
-                self.echo_slider.set(preset_config.get('echo', 0.0) * 10)
-                self.pitch_slider.set(preset_config.get('pitch_shift', 1.0) * 10)
-                self.distortion_slider.set(preset_config.get('distortion', 0.0) * 10)
-                self.lowpass_var.set(preset_config.get('lowpass', False))
-                self.highpass_var.set(preset_config.get('highpass', False))
-                self.robot_var.set(preset_config.get('robot', False))
-                self.reverb_var.set(preset_config.get('reverb', False))
-                self.chorus_var.set(preset_config.get('chorus', False))
-                # Update display values
-                self.gain_value.configure(text=f"{preset_config.get('gain', 1.0):.1f}x")
-                self.echo_value.configure(text=f"{preset_config.get('echo', 0.0):.1f}")
-                self.pitch_value.configure(text=f"{preset_config.get('pitch_shift', 1.0):.1f}x")
-                self.distortion_value.configure(text=f"{preset_config.get('distortion', 0.0):.1f}")
+                # Apply preset settings to UI; setting widgets programmatically
+                # does not fire their commands, so DSP runs once at the end
+                for slider, label, key, default, scale, fmt in self._preset_bindings:
+                    value = preset_config.get(key, default)
+                    slider.set(value * scale)
+                    label.configure(text=fmt.format(value))
+                for var, key in self._preset_flags:
+                    var.set(preset_config.get(key, False))
                 # Save the current effect/filter state for export
                 self.save_current_effects_state()
-                self.process_audio()
+                self._schedule_process()
 
     def update_device(self, _=None):
-        I,O = self.recorder.get_devices()
-
         current_input = self.input_device_menu.get()
         current_output = self.output_device_menu.get()
 
-        getInputID = next((i for i, name in I if name == current_input),None)
-        getOutputID = next((i for i, name in O if name == current_output),None)
+        getInputID = self._name_to_input_id.get(current_input)
+        getOutputID = self._name_to_output_id.get(current_output)
 
         self.recorder.update_IO_device(getInputID,getOutputID)
 
@@ -641,39 +632,105 @@ class VoiceChangerApp:
             'reverb': self.reverb_var.get(),
             'chorus': self.chorus_var.get(),
         }
-
-    def process_audio(self):
         
+        # Build the DSP kwargs and cache key here, once per UI change, so
+        # queuing a DSP request never has to read the Tk variables
+        state = self.current_effects_state
+        params = {
+            'gain': state['gain'],
+            'echo': state['echo'],
+            'lowpass': state['lowpass'],
+            'highpass': state['highpass'],
+            'robot': state['robot'],
+            'reverb': state['reverb'],
+            'pitch': state['pitch_shift'],
+            'chorus': state['chorus'],
+            'distortion': state['distortion'],
+        }
+        filters_bitmask = (state['lowpass'] | (state['highpass'] << 1) | (state['robot'] << 2)
+                           | (state['reverb'] << 3) | (state['chorus'] << 4))
+        key = (state['gain'], state['echo'], state['pitch_shift'], state['distortion'], filters_bitmask)
+        self._params_cache = (params, key)
+
+    def _post_params(self):
+        """Queue the current audio and effect settings for the DSP worker"""
         if self.current_audio is None:
             return
-        try:
-            gain = self.gain_slider.get() / 10
-            echo = self.echo_slider.get() / 10
-            lowpass = self.lowpass_var.get()
-            highpass = self.highpass_var.get()
-            robot = self.robot_var.get()
-            reverb = self.reverb_var.get()
-            pitch = self.pitch_slider.get() / 10
-            chorus = self.chorus_var.get()
-            distortion = self.distortion_slider.get() / 10
-            self.processed_audio = self.dsp.process_audio(
-                self.current_audio,
-                gain=gain,
-                echo=echo,
-                lowpass=lowpass,
-                highpass=highpass,
-                robot=robot,
-                reverb=reverb,
-                pitch=pitch,
-                chorus=chorus,
-                distortion=distortion
-            )
-            if self.processed_audio is not None and self.sample_rate is not None:
-                self.update_visualizer(self.processed_audio, self.sample_rate)
-            self.processed_audio = np.clip(self.processed_audio, -1.0, 1.0)
-            return self.processed_audio.astype(np.float32)
-        except Exception as e:
-            print(f"Processing error: {str(e)}")
+        params, key = self._params_cache
+        request = (self.current_audio, params, key)
+        # Drop any request the worker has not picked up yet
+        while True:
+            try:
+                self.dsp_request_q.put_nowait(request)
+                break
+            except queue.Full:
+                try:
+                    self.dsp_request_q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def dsp_worker_loop(self):
+        """Background thread running the DSP chain for queued requests"""
+        while True:
+            request = self.dsp_request_q.get()
+            # Skip to the newest request
+            try:
+                while True:
+                    request = self.dsp_request_q.get_nowait()
+            except queue.Empty:
+                pass
+            audio, params, key = request
+            try:
+                out = self.process_audio(audio, params, key)
+            except Exception as e:
+                print(f"Processing error: {str(e)}")
+                continue
+            self.root.after(0, self._on_dsp_done, audio, out)
+
+    def _on_dsp_done(self, source, out):
+        """Publish a finished DSP result on the Tk thread"""
+        if source is not self.current_audio:
+            return  # Superseded by newer audio
+        self.processed_audio = out
+        if self.sample_rate is not None:
+            self.update_visualizer(self.processed_audio, self.sample_rate)
+        if not (self.is_recording or self.is_playing):
+            self.set_button_states(can_play=True)
+            self._configure(self.export_button, state="normal")
+
+    def process_audio(self, audio, params, key):
+        """
+        Run the DSP chain (called on the DSP worker)
+
+        Args:
+            audio: Input audio data
+            params: Keyword arguments for DSPProcessor.process_audio
+            key: (gain, echo, pitch, distortion, filters bitmask) for params
+
+        Returns:
+            Processed float32 audio clipped to -1.0..1.0
+        """
+        # Same source and settings as last time: reuse the previous result
+        last = self._last_params
+        if last is not None and last[0] == key and last[1] is audio:
+            return last[2]
+        
+        identity = (abs(params['gain'] - 1.0) < 1e-6 and params['echo'] < 1e-6
+                    and abs(params['pitch'] - 1.0) < 1e-6 and params['distortion'] < 1e-6
+                    and not key[4])
+        if identity:
+            # Every effect is neutral, so the source is the result; clip only if it is out of range
+            if audio.size and np.abs(audio).max() > 1.0:
+                result = np.clip(audio, -1.0, 1.0)
+            else:
+                result = audio
+        else:
+            # DSPProcessor.process_audio already clips and casts to float32
+            # inside its final fused Numba kernel, so no extra pass is needed
+            result = self.dsp.process_audio(audio, **params)
+        
+        self._last_params = (key, audio, result)
+        return result
 
     def _on_mousewheel(self, event):
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -681,24 +738,39 @@ class VoiceChangerApp:
     def audio_processing_loop(self):
         """Background thread for processing audio data"""
         while True:
+            # Block until audio arrives; None is the shutdown sentinel
+            audio_data = self.audio_queue.get()
+            if audio_data is None or self._stop_event.is_set():
+                break
             try:
-                # Get audio data from queue
-                audio_data = self.audio_queue.get(timeout=0.1)
-                if audio_data is not None:
-                    self.current_audio = audio_data
-                    self.sample_rate = self.recorder.sample_rate
-                    self.process_audio()
-                    self.update_visualizer(audio_data, self.sample_rate)
-                    self.play_button.configure(state="normal")
-                    self.export_button.configure(state="normal")
-            except queue.Empty:
-                continue
+                # Do the array work here; Tk is only touched on the main thread
+                mono = self._to_visual_mono(audio_data, use_scratch=False)
+                self.root.after(0, self._on_recording_ready, audio_data, mono)
             except Exception as e:
                 print(f"Audio processing error: {e}")
     
+    def _on_recording_ready(self, audio_data, mono):
+        """Publish a finished recording on the Tk thread"""
+        # Keep the source in float32 so the DSP entry never has to convert
+        self.current_audio = np.ascontiguousarray(audio_data, dtype=np.float32)
+        self.sample_rate = self.recorder.sample_rate
+        self._post_params()
+        self._vis_cache = (self.current_audio, mono)
+        self.update_visualizer(self.current_audio, self.sample_rate)
+        self._configure(self.play_button, state="normal")
+        self._configure(self.export_button, state="normal")
+    
+    def shutdown(self):
+        """Stop the audio processing thread"""
+        self._stop_event.set()
+        self.audio_queue.put(None)
+    
     def run(self):
         """Start the application"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.shutdown()
 
 if __name__ == "__main__":
     app = VoiceChangerApp()
@@ -1,175 +1,190 @@
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Tuple
+
+# Built-in presets, built once at import and shared read-only by every
+# PresetManager
+_BUILTIN_PRESETS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "Demon": MappingProxyType({
+        "name": "Demon",
+        "description": "Deep, dark, demonic voice effect",
+        "gain": 1.2,
+        "echo": 0.3,
+        "lowpass": True,
+        "highpass": False,
+        "robot": False,
+        "reverb": True,
+        "pitch_shift": 0.7,  # Lower pitch
+        "distortion": 0.4,
+        "compression": True,
+        "compression_threshold": 0.3,
+        "compression_ratio": 6.0
+    }),
+    
+    "Robot": MappingProxyType({
+        "name": "Robot",
+        "description": "Mechanical, robotic voice effect",
+        "gain": 1.0,
+        "echo": 0.1,
+        "lowpass": False,
+        "highpass": True,
+        "robot": True,
+        "reverb": False,
+        "pitch_shift": 1.0,  # No pitch shift
+        "distortion": 0.2,
+        "compression": True,
+        "compression_threshold": 0.4,
+        "compression_ratio": 4.0
+    }),
+    
+    "Underwater": MappingProxyType({
+        "name": "Underwater",
+        "description": "Muffled, underwater voice effect",
+        "gain": 0.8,
+        "echo": 0.2,
+        "lowpass": True,
+        "highpass": False,
+        "robot": False,
+        "reverb": True,
+        "pitch_shift": 0.9,  # Slightly lower pitch
+        "distortion": 0.0,
+        "compression": False,
+        "chorus": True,
+        "chorus_depth": 0.003,
+        "chorus_rate": 0.8
+    }),
+    
+    "Walkie Talkie": MappingProxyType({
+        "name": "Walkie Talkie",
+        "description": "Radio communication voice effect",
+        "gain": 1.1,
+        "echo": 0.0,
+        "lowpass": False,
+        "highpass": True,
+        "robot": False,
+        "reverb": False,
+        "pitch_shift": 1.0,
+        "distortion": 0.3,
+        "compression": True,
+        "compression_threshold": 0.5,
+        "compression_ratio": 3.0,
+        "noise": True,
+        "noise_level": 0.05
+    }),
+    
+    "Alien": MappingProxyType({
+        "name": "Alien",
+        "description": "Otherworldly, alien voice effect",
+        "gain": 1.3,
+        "echo": 0.4,
+        "lowpass": False,
+        "highpass": True,
+        "robot": False,
+        "reverb": True,
+        "pitch_shift": 1.4,  # Higher pitch
+        "distortion": 0.6,
+        "compression": True,
+        "compression_threshold": 0.2,
+        "compression_ratio": 8.0,
+        "chorus": True,
+        "chorus_depth": 0.005,
+        "chorus_rate": 2.0
+    }),
+    
+    "Helium": MappingProxyType({
+        "name": "Helium",
+        "description": "High-pitched helium voice effect",
+        "gain": 0.9,
+        "echo": 0.0,
+        "lowpass": False,
+        "highpass": True,
+        "robot": False,
+        "reverb": False,
+        "pitch_shift": 2.0,  # Much higher pitch
+        "distortion": 0.0,
+        "compression": False
+    }),
+    
+    "Deep Voice": MappingProxyType({
+        "name": "Deep Voice",
+        "description": "Deep, bass-boosted voice effect",
+        "gain": 1.1,
+        "echo": 0.1,
+        "lowpass": True,
+        "highpass": False,
+        "robot": False,
+        "reverb": False,
+        "pitch_shift": 0.6,  # Lower pitch
+        "distortion": 0.0,
+        "compression": True,
+        "compression_threshold": 0.6,
+        "compression_ratio": 2.0
+    }),
+    
+    "Echo Chamber": MappingProxyType({
+        "name": "Echo Chamber",
+        "description": "Heavy echo and reverb effect",
+        "gain": 0.8,
+        "echo": 0.7,
+        "lowpass": False,
+        "highpass": False,
+        "robot": False,
+        "reverb": True,
+        "pitch_shift": 1.0,
+        "distortion": 0.0,
+        "compression": False
+    }),
+    
+    "Telephone": MappingProxyType({
+        "name": "Telephone",
+        "description": "Classic telephone voice effect",
+        "gain": 1.0,
+        "echo": 0.0,
+        "lowpass": True,
+        "highpass": True,
+        "robot": False,
+        "reverb": False,
+        "pitch_shift": 1.0,
+        "distortion": 0.1,
+        "compression": True,
+        "compression_threshold": 0.7,
+        "compression_ratio": 2.5
+    }),
+    
+    "Megaphone": MappingProxyType({
+        "name": "Megaphone",
+        "description": "Megaphone/PA system voice effect",
+        "gain": 1.4,
+        "echo": 0.0,
+        "lowpass": False,
+        "highpass": True,
+        "robot": False,
+        "reverb": False,
+        "pitch_shift": 1.0,
+        "distortion": 0.5,
+        "compression": True,
+        "compression_threshold": 0.3,
+        "compression_ratio": 5.0
+    })
+})
 
 class PresetManager:
+    __slots__ = ("presets", "_desc_cache")
+    
+    # Names of the built-in presets, which cannot be removed
+    _BUILT_IN: FrozenSet[str] = frozenset(_BUILTIN_PRESETS)
+    
+    # Allowed (min, max) for range-checked preset fields
+    _VALID_RANGES: Dict[str, Tuple[float, float]] = {
+        'gain': (0.1, 3.0),
+        'echo': (0.0, 1.0),
+        'pitch_shift': (0.1, 3.0),
+        'distortion': (0.0, 1.0),
+    }
+    
     def __init__(self):
         """Initialize the preset manager with predefined voice effect presets"""
-        self.presets = self._create_presets()
-    
-    def _create_presets(self) -> Dict[str, Dict[str, Any]]:
-        """Create the predefined presets"""
-        return {
-            "Demon": {
-                "name": "Demon",
-                "description": "Deep, dark, demonic voice effect",
-                "gain": 1.2,
-                "echo": 0.3,
-                "lowpass": True,
-                "highpass": False,
-                "robot": False,
-                "reverb": True,
-                "pitch_shift": 0.7,  # Lower pitch
-                "distortion": 0.4,
-                "compression": True,
-                "compression_threshold": 0.3,
-                "compression_ratio": 6.0
-            },
-            
-            "Robot": {
-                "name": "Robot",
-                "description": "Mechanical, robotic voice effect",
-                "gain": 1.0,
-                "echo": 0.1,
-                "lowpass": False,
-                "highpass": True,
-                "robot": True,
-                "reverb": False,
-                "pitch_shift": 1.0,  # No pitch shift
-                "distortion": 0.2,
-                "compression": True,
-                "compression_threshold": 0.4,
-                "compression_ratio": 4.0
-            },
-            
-            "Underwater": {
-                "name": "Underwater",
-                "description": "Muffled, underwater voice effect",
-                "gain": 0.8,
-                "echo": 0.2,
-                "lowpass": True,
-                "highpass": False,
-                "robot": False,
-                "reverb": True,
-                "pitch_shift": 0.9,  # Slightly lower pitch
-                "distortion": 0.0,
-                "compression": False,
-                "chorus": True,
-                "chorus_depth": 0.003,
-                "chorus_rate": 0.8
-            },
-            
-            "Walkie Talkie": {
-                "name": "Walkie Talkie",
-                "description": "Radio communication voice effect",
-                "gain": 1.1,
-                "echo": 0.0,
-                "lowpass": False,
-                "highpass": True,
-                "robot": False,
-                "reverb": False,
-                "pitch_shift": 1.0,
-                "distortion": 0.3,
-                "compression": True,
-                "compression_threshold": 0.5,
-                "compression_ratio": 3.0,
-                "noise": True,
-                "noise_level": 0.05
-            },
-            
-            "Alien": {
-                "name": "Alien",
-                "description": "Otherworldly, alien voice effect",
-                "gain": 1.3,
-                "echo": 0.4,
-                "lowpass": False,
-                "highpass": True,
-                "robot": False,
-                "reverb": True,
-                "pitch_shift": 1.4,  # Higher pitch
-                "distortion": 0.6,
-                "compression": True,
-                "compression_threshold": 0.2,
-                "compression_ratio": 8.0,
-                "chorus": True,
-                "chorus_depth": 0.005,
-                "chorus_rate": 2.0
-            },
-            
-            "Helium": {
-                "name": "Helium",
-                "description": "High-pitched helium voice effect",
-                "gain": 0.9,
-                "echo": 0.0,
-                "lowpass": False,
-                "highpass": True,
-                "robot": False,
-                "reverb": False,
-                "pitch_shift": 2.0,  # Much higher pitch
-                "distortion": 0.0,
-                "compression": False
-            },
-            
-            "Deep Voice": {
-                "name": "Deep Voice",
-                "description": "Deep, bass-boosted voice effect",
-                "gain": 1.1,
-                "echo": 0.1,
-                "lowpass": True,
-                "highpass": False,
-                "robot": False,
-                "reverb": False,
-                "pitch_shift": 0.6,  # Lower pitch
-                "distortion": 0.0,
-                "compression": True,
-                "compression_threshold": 0.6,
-                "compression_ratio": 2.0
-            },
-            
-            "Echo Chamber": {
-                "name": "Echo Chamber",
-                "description": "Heavy echo and reverb effect",
-                "gain": 0.8,
-                "echo": 0.7,
-                "lowpass": False,
-                "highpass": False,
-                "robot": False,
-                "reverb": True,
-                "pitch_shift": 1.0,
-                "distortion": 0.0,
-                "compression": False
-            },
-            
-            "Telephone": {
-                "name": "Telephone",
-                "description": "Classic telephone voice effect",
-                "gain": 1.0,
-                "echo": 0.0,
-                "lowpass": True,
-                "highpass": True,
-                "robot": False,
-                "reverb": False,
-                "pitch_shift": 1.0,
-                "distortion": 0.1,
-                "compression": True,
-                "compression_threshold": 0.7,
-                "compression_ratio": 2.5
-            },
-            
-            "Megaphone": {
-                "name": "Megaphone",
-                "description": "Megaphone/PA system voice effect",
-                "gain": 1.4,
-                "echo": 0.0,
-                "lowpass": False,
-                "highpass": True,
-                "robot": False,
-                "reverb": False,
-                "pitch_shift": 1.0,
-                "distortion": 0.5,
-                "compression": True,
-                "compression_threshold": 0.3,
-                "compression_ratio": 5.0
-            }
-        }
+        self.presets = dict(_BUILTIN_PRESETS)
+        self._desc_cache: Dict[str, str] = {}
     
     def get_preset(self, preset_name: str) -> Dict[str, Any]:
         """
@@ -179,18 +194,18 @@ class PresetManager:
             preset_name: Name of the preset
             
         Returns:
-            Preset configuration dictionary
+            Copy of the preset configuration dictionary
         """
-        return self.presets.get(preset_name, {})
+        return dict(self.presets.get(preset_name, {}))
     
     def get_all_presets(self) -> Dict[str, Dict[str, Any]]:
         """
         Get all available presets
         
         Returns:
-            Dictionary of all presets
+            Copy of all presets as plain dictionaries
         """
-        return self.presets.copy()
+        return {name: dict(config) for name, config in self.presets.items()}
     
     def get_preset_names(self) -> list:
         """
@@ -211,8 +226,12 @@ class PresetManager:
         Returns:
             Preset description
         """
-        preset = self.presets.get(preset_name, {})
-        return preset.get('description', 'No description available')
+        description = self._desc_cache.get(preset_name)
+        if description is None:
+            preset = self.presets.get(preset_name, {})
+            description = preset.get('description', 'No description available')
+            self._desc_cache[preset_name] = description
+        return description
     
     def add_custom_preset(self, name: str, config: Dict[str, Any]):
         """
@@ -224,6 +243,7 @@ class PresetManager:
         """
         if name and config:
             self.presets[name] = config.copy()
+            self._desc_cache.clear()
             print(f"Custom preset '{name}' added successfully")
         else:
             print("Invalid preset name or configuration")
@@ -239,16 +259,13 @@ class PresetManager:
             True if removed, False if not found or is built-in
         """
         # Don't allow removal of built-in presets
-        built_in_presets = ["Demon", "Robot", "Underwater", "Walkie Talkie", 
-                           "Alien", "Helium", "Deep Voice", "Echo Chamber", 
-                           "Telephone", "Megaphone"]
-        
-        if preset_name in built_in_presets:
+        if preset_name in self._BUILT_IN:
             print(f"Cannot remove built-in preset '{preset_name}'")
             return False
         
         if preset_name in self.presets:
             del self.presets[preset_name]
+            self._desc_cache.clear()
             print(f"Preset '{preset_name}' removed successfully")
             return True
         else:
@@ -273,6 +290,7 @@ class PresetManager:
             new_config['description'] = original_preset.get('description', 'Modified preset')
             
             self.presets[preset_name] = new_config
+            self._desc_cache.clear()
             print(f"Preset '{preset_name}' modified successfully")
             return True
         else:
@@ -286,14 +304,10 @@ class PresetManager:
         Returns:
             Formatted string with preset information
         """
-        summary = "Available Presets:\n"
-        summary += "=" * 50 + "\n"
-        
-        for name, config in self.presets.items():
-            description = config.get('description', 'No description')
-            summary += f"{name}: {description}\n"
-        
-        return summary
+        header = "Available Presets:\n" + "=" * 50
+        body = "\n".join(f"{name}: {config.get('description', 'No description')}"
+                         for name, config in self.presets.items())
+        return f"{header}\n{body}\n"
     
     def validate_preset_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -306,7 +320,6 @@ class PresetManager:
             True if valid, False otherwise
         """
         required_fields = ['name', 'description']
-        optional_fields = ['gain', 'echo', 'lowpass', 'highpass', 'robot', 'reverb']
         
         # Check required fields
         for field in required_fields:
@@ -314,13 +327,12 @@ class PresetManager:
                 print(f"Missing required field: {field}")
                 return False
         
-        # Check field types and ranges
-        if 'gain' in config and not (0.1 <= config['gain'] <= 3.0):
-            print("Gain must be between 0.1 and 3.0")
-            return False
-        
-        if 'echo' in config and not (0.0 <= config['echo'] <= 1.0):
-            print("Echo must be between 0.0 and 1.0")
-            return False
+        # Check field ranges in a single pass over the config
+        for field, value in config.items():
+            valid_range = self._VALID_RANGES.get(field)
+            if valid_range and not (valid_range[0] <= value <= valid_range[1]):
+                label = field.replace('_', ' ').capitalize()
+                print(f"{label} must be between {valid_range[0]} and {valid_range[1]}")
+                return False
         
         return True 
\ No newline at end of file
@@ -3,10 +3,26 @@ import sounddevice as sd
 import numpy as np
 import threading
 import queue
-from typing import Optional, Tuple
+from typing import Final, Optional, Tuple
+
+# Fixed frames per stream callback, so Python callback overhead is
+# amortized over a stable, reasonably large block
+BLOCKSIZE: Final = 1024
 
 class AudioRecorder:
-    def __init__(self, audio_queue: queue.Queue, sample_rate: int = 44100, channels: int = 1):
+    __slots__ = (
+        "audio_queue", "sample_rate", "channels",
+        "is_recording", "recording_thread", "stream", "is_recording_paused",
+        "is_playing", "is_playback_paused", "playback_thread", "is_playback_stopped",
+        "Ostream", "on_finished", "playback_index", "_play_data", "_play_total",
+        "_input_key", "_output_key",
+        "input_device", "output_device", "devices",
+        "_arena", "_write_idx", "_segments", "_spare",
+        "_stop_recording_evt", "_record_wake", "_playback_done",
+        "_devices_cache", "_devices_cache_ts",
+    )
+    
+    def __init__(self, audio_queue: queue.SimpleQueue, sample_rate: int = 44100, channels: int = 1):
         self.audio_queue = audio_queue
         self.sample_rate = sample_rate
         self.channels = channels
@@ -14,14 +30,32 @@ class AudioRecorder:
         # Recording state
         self.is_recording = False
         self.recording_thread = None
-        self.audio_buffer = []
         self.stream = None
+        self._input_key = None  # (device, sample rate, channels) of self.stream
+        
+        # Preallocated recording arena, filled in 60 s segments; a spare
+        # segment is allocated ahead of time off the audio callback
+        self._arena = self._new_segment()
+        self._write_idx = 0
+        self._segments = []
+        self._spare = None
+        
+        # Recording thread wake-ups: stop requests and spare segment refills
+        self._stop_recording_evt = threading.Event()
+        self._record_wake = threading.Event()
         
         # Playback state
+        self.is_playing = False
         self.is_playback_paused = False
         self.playback_thread = None
         self.is_playback_stopped = False
         self.Ostream = None
+        self._output_key = None  # (device, sample rate) of self.Ostream
+        self._play_data = None
+        self._play_total = 0
+        self.playback_index = 0
+        self.on_finished = None  # Called when a playback stream finishes
+        self._playback_done = threading.Event()
 
         # Pause
         self.is_recording_paused = True
@@ -30,13 +64,17 @@ class AudioRecorder:
         self.input_device = None
         self.output_device = None
         
+        # Cached device query result
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
+        
         # Initialize audio devices
         self._setup_audio_devices()
     
     def _setup_audio_devices(self):
         """Setup audio input and output devices"""
         try:
-            self.devices = sd.query_devices()
+            self.devices = self._cached_query_devices()
             default_input = sd.default.device[0]
             default_output = sd.default.device[1]
             
@@ -48,26 +86,50 @@ class AudioRecorder:
         except Exception as e:
             print(f"Error setting up audio devices: {e}")
     
+    def _cached_query_devices(self, ttl: float = 5.0):
+        """
+        Query the audio devices, reusing the last result for a short while
+        
+        Args:
+            ttl: Seconds a previous query result stays valid
+            
+        Returns:
+            sounddevice DeviceList
+        """
+        now = time.monotonic()
+        if self._devices_cache is None or now - self._devices_cache_ts >= ttl:
+            self._devices_cache = sd.query_devices()
+            self._devices_cache_ts = now
+        return self._devices_cache
+
     def get_devices(self):
+        self.devices = self._cached_query_devices()
+        
         input_device = []
         output_device = []
 
+        # The channel counts from the device query are enough; no need to
+        # open a stream on every device
         for i, dev in enumerate(self.devices):
             if dev['max_input_channels'] > 0:
-                try:
-                    with sd.InputStream(device=i, channels=1, samplerate=44100):
-                        input_device.append((i, dev['name']))
-                except Exception:
-                    pass
+                input_device.append((i, dev['name']))
             if dev['max_output_channels'] > 0:
-                try:
-                    with sd.OutputStream(device=i, channels=1, samplerate=44100):
-                        output_device.append((i, dev['name']))
-                except Exception:
-                    pass
+                output_device.append((i, dev['name']))
 
         return input_device, output_device
 
+    def _stream_settings(self, latency: str) -> dict:
+        """
+        Build keyword arguments for opening a stream
+        
+        Args:
+            latency: 'low' or 'high'
+            
+        Returns:
+            Dictionary of stream keyword arguments
+        """
+        return {'blocksize': BLOCKSIZE, 'latency': latency}
+
     def update_IO_device(self, input, output):
         self.input_device = input
         self.output_device = output
@@ -79,7 +141,11 @@ class AudioRecorder:
             
         self.is_recording = True
         self.is_recording_paused = False
-        self.audio_buffer = []
+        if self._arena is None:
+            self._arena = self._new_segment()
+        self._write_idx = 0
+        self._segments = []
+        self._stop_recording_evt.clear()
         self.recording_thread = threading.Thread(target=self._record_audio, daemon=True)
         self.recording_thread.start()
     
@@ -89,38 +155,84 @@ class AudioRecorder:
             return
             
         self.is_recording = False
+        self._stop_recording_evt.set()
+        self._record_wake.set()
         
         if self.recording_thread:
             self.recording_thread.join(timeout=1.0)
         
-        if self.stream:
-            self.stream.close()
-            self.stream = None
-        
-        # Combine all recorded audio chunks
-        if self.audio_buffer:
-            recorded_audio = np.concatenate(self.audio_buffer)
-            self.audio_queue.put(recorded_audio)
+        # Hand the filled part of the arena over; the next recording gets a
+        # fresh arena
+        parts = self._segments + [self._arena[:self._write_idx]]
+        self._segments = []
+        self._arena = None
+        if len(parts) == 1:
+            # Single segment: a view, no copy needed
+            if len(parts[0]):
+                self.audio_queue.put(parts[0])
+        else:
+            # Join long recordings off the caller's (UI) thread
+            threading.Thread(target=self._finalize_buffer, args=(parts,), daemon=True).start()
     
-    def _record_audio(self):
-        try:
-            def callback(indata, frames, time, status):
-                if self.is_recording and not self.is_recording_paused:
-                    self.audio_buffer.append(indata.copy())
-            
+    def _finalize_buffer(self, parts: list):
+        """Join recorded segments and queue the result"""
+        self.audio_queue.put(np.concatenate(parts))
+    
+    def _new_segment(self) -> np.ndarray:
+        """Allocate one 60 s recording segment"""
+        return np.empty((self.sample_rate * 60, self.channels), dtype=np.float32)
+    
+    def _write_block(self, block: np.ndarray):
+        """Copy an input block into the arena, moving to a new segment when full"""
+        start = 0
+        n = len(block)
+        while start < n:
+            take = min(len(self._arena) - self._write_idx, n - start)
+            src = block if take == n else block[start:start + take]
+            np.copyto(self._arena[self._write_idx:self._write_idx + take], src)
+            self._write_idx += take
+            start += take
+            if self._write_idx == len(self._arena):
+                self._segments.append(self._arena)
+                spare, self._spare = self._spare, None
+                self._arena = spare if spare is not None else self._new_segment()
+                self._write_idx = 0
+                self._record_wake.set()  # Ask the recording thread for a new spare
+    
+    def _get_input_stream(self) -> sd.InputStream:
+        """Return the shared input stream, reopening it only if settings changed"""
+        key = (self.input_device, self.sample_rate, self.channels)
+        if self.stream is None or self._input_key != key:
+            if self.stream is not None:
+                self.stream.close()
             self.stream = sd.InputStream(
                 device=self.input_device,
                 channels=self.channels,
                 samplerate=self.sample_rate,
-                callback=callback,
-                dtype=np.float32
+                callback=self._shared_input_callback,
+                dtype=np.float32,
+                **self._stream_settings('high')
             )
-            
-            with self.stream:
-                print("Recording started...")
-                while self.is_recording:
-                    sd.sleep(100)
-                print("Recording stopped.")
+            self._input_key = key
+        return self.stream
+    
+    def _shared_input_callback(self, indata, frames, time, status):
+        if self.is_recording and not self.is_recording_paused:
+            self._write_block(indata)
+    
+    def _record_audio(self):
+        try:
+            stream = self._get_input_stream()
+            stream.start()
+            print("Recording started...")
+            while not self._stop_recording_evt.is_set():
+                # Keep a spare segment ready so the callback never allocates
+                if self._spare is None:
+                    self._spare = self._new_segment()
+                self._record_wake.wait()
+                self._record_wake.clear()
+            stream.stop()
+            print("Recording stopped.")
                 
         except Exception as e:
             print(f"Recording error: {e}")
@@ -130,6 +242,10 @@ class AudioRecorder:
         """Play audio data through speakers"""
         if self.is_playback_paused:
             return
+        
+        # Convert once here so the callback only ever does a plain memcpy
+        if audio_data.dtype != np.float32 or not audio_data.flags.c_contiguous:
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
             
         self.is_playback_paused = True
         
@@ -139,74 +255,96 @@ class AudioRecorder:
             args=(audio_data,), 
             daemon=True
         )
+        self.is_playing = True
         self.playback_thread.start()
     
     def stop_playback(self):
         """Stop audio playback"""
-        if not self.is_playback_paused:
+        if self.playback_thread is None or not self.playback_thread.is_alive():
             return
             
         self.is_playback_paused = False
         self.is_playback_stopped = True
+        self.is_playing = False
+        self._playback_done.set()
         if self.playback_thread:
             self.playback_thread.join(timeout=1.0)
         
         
         
     
+    def _get_output_stream(self) -> sd.OutputStream:
+        """Return the shared output stream, reopening it only if settings changed"""
+        key = (self.output_device, self.sample_rate)
+        if self.Ostream is None or self._output_key != key:
+            if self.Ostream is not None:
+                self.Ostream.close()
+            self.Ostream = sd.OutputStream(
+                device=self.output_device,
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype=np.float32,
+                callback=self._shared_output_callback,
+                finished_callback=self._on_playback_finished,
+                **self._stream_settings('low')
+            )
+            self._output_key = key
+        return self.Ostream
+    
+    def _shared_output_callback(self, outdata, frames, time, status):
+        if self.is_playback_stopped:
+            self._playback_done.set()
+            raise sd.CallbackStop()
+        if self.is_playback_paused:
+            outdata.fill(0)
+            return
+        idx = self.playback_index
+        n = min(frames, self._play_total - idx)
+        np.copyto(outdata[:n], self._play_data[idx:idx + n])
+        if n < frames:
+            outdata[n:].fill(0)
+            self.is_playback_stopped = True
+            self._playback_done.set()
+            raise sd.CallbackStop()
+
+        self.playback_index = idx + n
+    
     def _play_audio(self, audio_data: np.ndarray):
         try:
             
-            if len(audio_data.shape) == 1:
-                audio_data = audio_data.reshape(-1, 1)
+            if audio_data.ndim == 1:
+                audio_data = audio_data[:, np.newaxis]  # View, never a copy
 
+            self._play_data = audio_data
+            self._play_total = len(audio_data)
             self.playback_index = 0
             self.is_playback_paused = False
-            def callback(outdata, frames, time, status):
-                if self.is_playback_stopped:
-                    raise sd.CallbackStop()
-                if self.is_playback_paused:
-                    outdata.fill(0)
-                    return
-                end = self.playback_index + frames
-                chunk = audio_data[self.playback_index:end]
-
-                if len(chunk) < frames:
-                    outdata[:len(chunk)] = chunk
-                    outdata[len(chunk):].fill(0)
-                    raise sd.CallbackStop()
-                else:
-                    outdata[:] = chunk
-
-                self.playback_index += frames
-
-                
+            self.is_playback_stopped = False
+            self._playback_done.clear()
             
-            
-             
-            self.Ostream = sd.OutputStream(
-                device=self.output_device,
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype=np.float32,
-                callback=callback
-            )
-            self.Ostream.start()
-            while not self.is_playback_stopped:
-                time.sleep(0.05)
-            self.Ostream.stop()
-            self.Ostream.close()
-            self.Ostream = None
+            stream = self._get_output_stream()
+            stream.start()
+            self._playback_done.wait()
+            stream.stop()
+            self._play_data = None
             
         except Exception as e:
             print(f"Playback error: {e}")
             self.is_playback_paused = False
             self.is_playback_stopped = True
     
+    def _on_playback_finished(self):
+        """Called by PortAudio once the output stream has become inactive"""
+        self.is_playback_stopped = True
+        self.is_playing = False
+        self._playback_done.set()
+        if self.on_finished is not None:
+            self.on_finished()
+    
     def get_audio_devices(self) -> Tuple[list, list]:
         """Get available input and output devices"""
         try:
-            devices = sd.query_devices()
+            devices = self._cached_query_devices()
             input_devices = []
             output_devices = []
             
@@ -225,7 +363,7 @@ class AudioRecorder:
     def set_input_device(self, device_index: int):
         """Set the input device for recording"""
         try:
-            devices = sd.query_devices()
+            devices = self._cached_query_devices()
             if 0 <= device_index < len(devices):
                 device = devices[device_index]
                 if isinstance(device, dict) and device.get('max_inputs', 0) > 0:
@@ -241,7 +379,7 @@ class AudioRecorder:
     def set_output_device(self, device_index: int):
         """Set the output device for playback"""
         try:
-            devices = sd.query_devices()
+            devices = self._cached_query_devices()
             if 0 <= device_index < len(devices):
                 device = devices[device_index]
                 if isinstance(device, dict) and device.get('max_outputs', 0) > 0:
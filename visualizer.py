@@ -1,61 +1,194 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import logging
 import numpy as np
-import customtkinter as ctk
-from typing import Optional
+import queue
+import threading
+import tkinter as tk
+from typing import TYPE_CHECKING, Optional
+
+# matplotlib, customtkinter, numba and scipy are imported on first use to keep module import fast
+if TYPE_CHECKING:
+    import customtkinter as ctk
+
+logger = logging.getLogger(__name__)
+
+
+_minmax_kernel = None
+
+
+def _minmax(a):
+    """Find the minimum and maximum of a non-empty float32 array, compiling the kernel on first use"""
+    global _minmax_kernel
+    if _minmax_kernel is None:
+        from numba import njit
+        # No eager signature, so read-only arrays get their own specialization
+        _minmax_kernel = njit(fastmath=True, cache=True)(_minmax_loop)
+    return _minmax_kernel(a)
+
+
+def _minmax_loop(a):
+    """
+    Find the minimum and maximum of a non-empty array in a single pass
+    
+    Args:
+        a: Audio samples
+        
+    Returns:
+        Tuple of (minimum, maximum)
+    """
+    lo = a[0]
+    hi = a[0]
+    for i in range(1, a.shape[0]):
+        v = a[i]
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+    return lo, hi
+
+
+def _as_float32_1d(a) -> np.ndarray:
+    """Return audio as a contiguous 1D float32 array, copying only if it is not one already"""
+    if isinstance(a, np.ndarray) and a.dtype == np.float32 and a.ndim == 1 and a.flags.c_contiguous:
+        return a
+    return np.ascontiguousarray(np.asarray(a, dtype=np.float32).ravel())
+
 
 class AudioVisualizer:
-    def __init__(self, max_points: int = 1000):
+    def __init__(self, max_points: int = 1000, backend: str = 'matplotlib'):
         """
         Initialize the audio visualizer
         
         Args:
             max_points: Maximum number of points to display in the waveform
+            backend: Renderer for the real-time waveform, 'matplotlib' or 'native'
+                (a plain Tk canvas, bypassing Agg)
         """
         self.max_points = max_points
+        self.backend = backend
         self.fig = None
         self.ax = None
         self.canvas = None
         self.line = None
         self.animation = None
         
+        # Native real-time canvas and its line item, created with the matplotlib canvas
+        self.tk_canvas = None
+        self._line_id = None
+        self._native_shown = False
+        
+        # Interleaved x, y pixel coordinates for the native line, and the cached x pixels
+        self._xy_scratch = None
+        self._x_pixels = None
+        self._x_pixels_key = None
+        
+        # Blitting state: cached axes background without the waveform line
+        self._bg = None
+        
+        # Pending idle redraw; a full redraw requested by any caller wins over a blit
+        self._redraw_scheduled = False
+        self._redraw_full = False
+        
+        # Axis limits last applied by update_realtime
+        self._xlim_cache = None
+        self._ylim_cache = None
+        
+        # (length, sample rate) of the x data set on the line by a full realtime window
+        self._line_x_key = None
+        
+        # Realtime ring buffer, stored twice back to back so the window is always one slice
+        self._ring = None
+        self._ring_view = None
+        self._write = 0
+        self._filled = False
+        
+        # Realtime chunks are queued by the audio thread and drawn on the Tk thread at up to 30 fps
+        self._pending = queue.Queue(maxsize=2)
+        self._draw_interval = 1 / 30
+        # The drain loop only runs while chunks keep arriving
+        self._drain_lock = threading.Lock()
+        self._drain_running = False
+        
         # Data storage
         self.audio_data = None
         self.sample_rate = None
         self.time_axis = None
         
-        # Setup the plot
-        self._setup_plot()
+        # Shared sample-time array, rebuilt only when the sample rate changes or more samples are needed
+        self._time_axis_cache = None
+        self._time_axis_rate = None
+        
+        # Last decimated waveform: (source, sample_rate, max_points, samples, times)
+        self._decim_cache = None
     
-    def _setup_plot(self):
-        """Setup the matplotlib figure and axes"""
+    def _ensure_figure(self):
+        """Create the figure on first use"""
+        if self.fig is None:
+            self._create_figure()
+    
+    def _create_figure(self):
+        """Create the matplotlib figure and axes, once per visualizer"""
+        import matplotlib
+        matplotlib.use('TkAgg', force=False)
+        import matplotlib.pyplot as plt
+        
         plt.style.use('dark_background')
-        self.fig, self.ax = plt.subplots(figsize=(10, 4), facecolor='black')
+        # Let Agg drop sub-pixel segments of dense lines and draw long paths in chunks
+        plt.rcParams['path.simplify'] = True
+        plt.rcParams['path.simplify_threshold'] = 1.0
+        plt.rcParams['agg.path.chunksize'] = 10000
+        self.fig, self.ax = plt.subplots(figsize=(10, 4), dpi=72, facecolor='black')
         self.fig.patch.set_facecolor('black')
-        self.ax.set_facecolor('black')
+        self._setup_waveform_axes()
+        self.fig.tight_layout()
+    
+    def _setup_waveform_axes(self, color: str = 'lime', linewidth: float = 2.0):
+        """
+        Style the (empty) axes for the waveform and add the waveform line
+        
+        Args:
+            color: Line color
+            linewidth: Line width in points
+        """
+        self._style_axes(self.ax, 'Amplitude', 'Audio Waveform')
         self.ax.grid(True, alpha=0.3, color='gray')
-        self.ax.set_xlabel('Time (s)', color='white')
-        self.ax.set_ylabel('Amplitude', color='white')
-        self.ax.set_title('Audio Waveform', color='white', fontsize=14, fontweight='bold')
-        self.ax.spines['bottom'].set_color('white')
-        self.ax.spines['top'].set_color('white')
-        self.ax.spines['left'].set_color('white')
-        self.ax.spines['right'].set_color('white')
-        self.ax.tick_params(colors='white')
-        # Force green line
-        self.line, = self.ax.plot([], [], color='lime', linewidth=2.0, alpha=0.9)
+        # Force green line, drawn by blitting on top of the cached background
+        self.line, = self.ax.plot([], [], color=color, linewidth=linewidth, alpha=0.9, animated=True)
+        self.line.set_path_effects([])
+        self.line.set_antialiased(False)
         self.ax.set_xlim(0, 1)
         self.ax.set_ylim(-1, 1)
-        self.fig.tight_layout()
     
-    def create_canvas(self, parent) -> ctk.CTkFrame:
+    @staticmethod
+    def _style_axes(ax, ylabel: str, title: str):
+        """
+        Apply the dark theme to an axes
+        
+        Args:
+            ax: Axes to style
+            ylabel: Y axis label
+            title: Plot title
+        """
+        ax.set_facecolor('black')
+        ax.set_xlabel('Time (s)', color='white')
+        ax.set_ylabel(ylabel, color='white')
+        ax.set_title(title, color='white', fontsize=14, fontweight='bold')
+        for spine in ax.spines.values():
+            spine.set_color('white')
+        ax.tick_params(colors='white')
+    
+    def create_canvas(self, parent) -> "ctk.CTkFrame":
+        import customtkinter as ctk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.colors import to_hex
+        
+        self._ensure_figure()
         print("[Visualizer] Creating new canvas")
         # Create a frame to hold the canvas
         canvas_frame = ctk.CTkFrame(parent, fg_color="black")
         
         # Create the matplotlib canvas
         self.canvas = FigureCanvasTkAgg(self.fig, master=canvas_frame)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         
         # Get the TK widget and configure it
@@ -66,15 +199,114 @@ class AudioVisualizer:
         # Set a reasonable size
         canvas_widget.configure(width=800, height=300)
         
+        # Plain Tk canvas for the real-time waveform, swapped in while recording
+        if self.backend == 'native':
+            self.tk_canvas = tk.Canvas(canvas_frame, bg="black", highlightthickness=0, height=300)
+            self._line_id = self.tk_canvas.create_line(0, 0, 0, 0, fill=to_hex(self.line.get_color()),
+                                                       width=self.line.get_linewidth())
+        
         return canvas_frame  # Return the frame, not the widget
     
+    def _on_draw(self, event):
+        """Refresh the cached background after every full draw and repaint the line"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self._line_attached():
+            self.ax.draw_artist(self.line)
+    
+    def _line_attached(self) -> bool:
+        """Check that the waveform line is still on the axes (ax.clear() detaches it)"""
+        return self.line.axes is not None and self.line in self.ax.lines
+    
+    def _blit_line(self):
+        """Repaint only the waveform line over the cached background"""
+        if not self._line_attached():
+            return
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+    
+    def _show_native(self, native: bool):
+        """Swap between the native real-time canvas and the matplotlib canvas"""
+        if self.tk_canvas is None or native == self._native_shown:
+            return
+        mpl_widget = self.canvas.get_tk_widget()
+        if native:
+            mpl_widget.pack_forget()
+            self.tk_canvas.pack(fill="both", expand=True)
+        else:
+            self.tk_canvas.pack_forget()
+            mpl_widget.pack(fill="both", expand=True)
+        self._native_shown = native
+    
+    def _draw_native(self):
+        """Draw the real-time window on the native canvas, scaled to its pixel size"""
+        width = max(self.tk_canvas.winfo_width(), 1)
+        height = max(self.tk_canvas.winfo_height(), 1)
+        n = len(self.audio_data)
+        if n < 2:
+            self.tk_canvas.coords(self._line_id, 0, 0, 0, 0)
+            return
+        
+        # x pixels only change with the canvas width or window size
+        size = max(self.max_points, n)
+        if self._x_pixels_key != (width, size):
+            self._x_pixels = np.arange(size, dtype=np.float32) * np.float32(width / (size - 1))
+            self._x_pixels_key = (width, size)
+        if self._xy_scratch is None or len(self._xy_scratch) < 2 * size:
+            self._xy_scratch = np.empty(2 * size, dtype=np.float32)
+        
+        # Interleave in place: y_px = h/2 - amplitude * h/2
+        xy = self._xy_scratch[:2 * n]
+        xy[0::2] = self._x_pixels[:n]
+        y = xy[1::2]
+        np.multiply(self.audio_data, np.float32(-height / 2), out=y)
+        y += np.float32(height / 2)
+        self.tk_canvas.coords(self._line_id, xy.tolist())
+    
+    def _schedule_redraw(self, full: bool = False):
+        """
+        Redraw once Tk is idle, collapsing requests made before then into one redraw
+        
+        Args:
+            full: Redraw the whole figure instead of blitting the line
+        """
+        if not self.canvas:
+            return
+        self._redraw_full = self._redraw_full or full
+        if self._redraw_scheduled:
+            return
+        self._redraw_scheduled = True
+        self.canvas.get_tk_widget().after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Run the pending redraw, blitting when a background is cached"""
+        full = self._redraw_full
+        self._redraw_scheduled = False
+        self._redraw_full = False
+        if full or self._bg is None:
+            self.canvas.draw()
+        else:
+            self._blit_line()
+    
+    def _redraw_line(self):
+        """Show a change to the line only"""
+        if not self.canvas:
+            return
+        if self.tk_canvas is not None:
+            from matplotlib.colors import to_hex
+            self.tk_canvas.itemconfigure(self._line_id, fill=to_hex(self.line.get_color()),
+                                         width=self.line.get_linewidth())
+        self._schedule_redraw()
+    
     def update_waveform(self, audio_data: np.ndarray, sample_rate: int):
         try:
+            self._ensure_figure()
+            self._show_native(False)
+            
             # Ensure audio data is in correct format
-            audio_data = np.asarray(audio_data, dtype=np.float32)
-            audio_data = np.ravel(audio_data)  # Flatten to 1D
+            audio_data = _as_float32_1d(audio_data)
             
-            print(f"Updating waveform with {len(audio_data)} samples")
+            logger.debug("Updating waveform with %d samples", len(audio_data))
             
             # Store the data
             self.audio_data = audio_data
@@ -82,15 +314,10 @@ class AudioVisualizer:
             
             # Calculate duration and time axis
             duration = len(audio_data) / sample_rate
-            self.time_axis = np.linspace(0, duration, len(audio_data))
+            self.time_axis = self._get_time_axis(len(audio_data), sample_rate)
             
-            # Downsample if too many points
-            if len(audio_data) > self.max_points:
-                step = len(audio_data) // self.max_points
-                audio_data = audio_data[::step]
-                time_axis = self.time_axis[::step]
-            else:
-                time_axis = self.time_axis
+            # Reduce to at most max_points for display
+            audio_data, time_axis = self._decimate(audio_data, sample_rate)
             
             # Update the plot
             self.line.set_data(time_axis, audio_data)
@@ -99,67 +326,251 @@ class AudioVisualizer:
             x_padding = duration * 0.05
             y_padding = 0.1
             self.ax.set_xlim(0 - x_padding, duration + x_padding)
+            self._xlim_cache = None
+            self._ylim_cache = None
+            self._line_x_key = None
             
             if len(audio_data) > 0:
-                y_min = min(-0.1, audio_data.min() - y_padding)
-                y_max = max(0.1, audio_data.max() + y_padding)
+                lo, hi = _minmax(audio_data)
+                y_min = min(-0.1, lo - y_padding)
+                y_max = max(0.1, hi + y_padding)
                 self.ax.set_ylim(y_min, y_max)
             
             # Redraw the canvas
             if self.canvas:
                 self.canvas.draw_idle()
-                print("Waveform updated successfully")
+                logger.debug("Waveform updated successfully")
                 
         except Exception as e:
-            print(f"Error updating waveform: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error updating waveform: %s", e)
     
     def update_realtime(self, audio_chunk: np.ndarray, sample_rate: int):
         """
-        Update the waveform in real-time during recording
+        Queue a chunk for the real-time waveform during recording. Safe to call from
+        the audio thread; the oldest queued chunk is dropped if drawing falls behind.
         
         Args:
             audio_chunk: New audio chunk
             sample_rate: Sample rate of the audio
         """
+        # Copy, since the audio driver reuses its buffer for the next callback
+        item = (np.array(audio_chunk, dtype=np.float32).ravel(), sample_rate)
         try:
-            # Append new chunk to existing data
-            if self.audio_data is None:
-                self.audio_data = audio_chunk
-            else:
-                self.audio_data = np.concatenate([self.audio_data, audio_chunk])
+            self._pending.put_nowait(item)
+        except queue.Full:
+            try:
+                self._pending.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._pending.put_nowait(item)
+            except queue.Full:
+                pass
+        
+        # Start the drain loop on the first chunk after an idle period
+        if not self.canvas:
+            return
+        with self._drain_lock:
+            if self._drain_running:
+                return
+            self._drain_running = True
+        try:
+            self.canvas.get_tk_widget().after(0, self._drain)
+        except Exception:
+            # The canvas has been destroyed
+            self._drain_running = False
+    
+    def _drain(self):
+        """Draw all queued real-time chunks as one frame, then schedule the next frame,
+        stopping once a frame finds the queue empty"""
+        chunks = []
+        while True:
+            try:
+                chunks.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        if chunks:
+            self._draw_realtime(chunks)
+        else:
+            # Re-check under the lock so a chunk queued meanwhile is not stranded
+            with self._drain_lock:
+                if self._pending.empty():
+                    self._drain_running = False
+                    return
+        
+        try:
+            self.canvas.get_tk_widget().after(int(self._draw_interval * 1000), self._drain)
+        except Exception:
+            # The canvas has been destroyed
+            self._drain_running = False
+    
+    def _draw_realtime(self, chunks):
+        """
+        Append chunks to the real-time ring buffer and redraw the waveform
+        
+        Args:
+            chunks: List of (audio_chunk, sample_rate) tuples, oldest first
+        """
+        try:
+            self._ensure_figure()
+            # Append new chunks to the ring buffer, restarting it if the data was replaced elsewhere
+            if self.audio_data is None or self.audio_data is not self._ring_view:
+                previous = self.audio_data
+                self._reset_ring()
+                if previous is not None:
+                    self._ring_append(_as_float32_1d(previous))
+            for audio_chunk, sample_rate in chunks:
+                self.audio_data = self._ring_view = self._ring_append(_as_float32_1d(audio_chunk))
             
-            # Keep only the last N points for real-time display
-            max_points = self.max_points
-            if len(self.audio_data) > max_points:
-                self.audio_data = self.audio_data[-max_points:]
+            if self.tk_canvas is not None:
+                self._show_native(True)
+                self._draw_native()
+                return
             
-            # Create time axis for the visible portion
+            # Once the window is full its x values stay the same, so only y needs updating
             duration = len(self.audio_data) / sample_rate
-            time_axis = np.linspace(0, duration, len(self.audio_data))
-            
-            # Update the plot
-            self.line.set_data(time_axis, self.audio_data)  # type: ignore
+            x_key = (len(self.audio_data), sample_rate)
+            if self._filled and x_key == self._line_x_key:
+                self.line.set_ydata(self.audio_data)  # type: ignore
+            else:
+                time_axis = self._get_time_axis(len(self.audio_data), sample_rate)
+                self.line.set_data(time_axis, self.audio_data)  # type: ignore
+                self._line_x_key = x_key if self._filled else None
             
-            # Update axis limits
-            self.ax.set_xlim(0, duration)  # type: ignore
+            # Update axis limits only when they move noticeably, since that invalidates the background.
+            # The x range gets 5% headroom so a growing window does not resize it on every chunk.
+            limits_changed = False
+            xlim = self._xlim_cache
+            if xlim is None or duration > xlim[1] or duration < 0.95 * xlim[1]:
+                self._xlim_cache = (0, duration * 1.05)
+                self.ax.set_xlim(*self._xlim_cache)  # type: ignore
+                limits_changed = True
             if len(self.audio_data) > 0:
-                self.ax.set_ylim(self.audio_data.min() - 0.1, self.audio_data.max() + 0.1)  # type: ignore
+                lo, hi = _minmax(self.audio_data)
+                ylim = (lo - 0.1, hi + 0.1)
+                if self._limits_moved(ylim, self._ylim_cache):
+                    self._ylim_cache = ylim
+                    self.ax.set_ylim(*ylim)  # type: ignore
+                    limits_changed = True
             
-            # Redraw the canvas
-            if self.canvas:
-                self.canvas.draw_idle()
+            # Redraw the canvas: a full draw refreshes the background, otherwise blit the line
+            self._schedule_redraw(full=limits_changed)
                 
         except Exception as e:
-            print(f"Error updating real-time waveform: {e}")
+            logger.error("Error updating real-time waveform: %s", e)
+    
+    def _get_time_axis(self, n: int, sample_rate: int) -> np.ndarray:
+        """
+        Get sample times for the first n samples as a view of the shared cache
+        
+        Args:
+            n: Number of samples
+            sample_rate: Sample rate of the audio
+            
+        Returns:
+            float32 array of n sample times in seconds
+        """
+        cache = self._time_axis_cache
+        if cache is None or self._time_axis_rate != sample_rate or len(cache) < n:
+            cache = np.arange(max(n, self.max_points), dtype=np.float32) * np.float32(1.0 / sample_rate)
+            self._time_axis_cache = cache
+            self._time_axis_rate = sample_rate
+        return cache[:n]
+    
+    def _decimate(self, audio_data: np.ndarray, sample_rate: int):
+        """
+        Reduce audio to an interleaved min/max envelope if it has more than max_points samples,
+        reusing the previous result when called again with the same array
+        
+        Args:
+            audio_data: 1D float32 audio data
+            sample_rate: Sample rate of the audio
+            
+        Returns:
+            Tuple of (samples, sample times) to plot
+        """
+        cache = self._decim_cache
+        if (cache is not None and cache[0] is audio_data and cache[1] == sample_rate
+                and cache[2] == self.max_points):
+            return cache[3], cache[4]
+        
+        time_axis = self._get_time_axis(len(audio_data), sample_rate)
+        if len(audio_data) > self.max_points:
+            # Keep peaks visible by plotting each block's minimum and maximum
+            blocks = max(1, self.max_points // 2)
+            step = len(audio_data) // blocks
+            half = step // 2
+            folded = audio_data[:blocks * step].reshape(blocks, step)
+            samples = np.empty(2 * blocks, dtype=np.float32)
+            folded.min(axis=1, out=samples[0::2])
+            folded.max(axis=1, out=samples[1::2])
+            # Minimum at the start of each block, maximum at its midpoint
+            time_axis = time_axis[:2 * blocks * half:half]
+        else:
+            samples = audio_data
+        
+        # Holding the source keeps its id from being reused
+        self._decim_cache = (audio_data, sample_rate, self.max_points, samples, time_axis)
+        return samples, time_axis
+    
+    def _reset_ring(self):
+        """Empty the realtime ring buffer, reallocating it if max_points changed"""
+        if self._ring is None or len(self._ring) != 2 * self.max_points:
+            self._ring = np.zeros(2 * self.max_points, dtype=np.float32)
+        self._ring_view = None
+        self._write = 0
+        self._filled = False
+    
+    def _ring_append(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Write a chunk into the ring buffer
+        
+        Args:
+            chunk: 1D audio samples
+            
+        Returns:
+            View of the last max_points samples, oldest first
+        """
+        size = len(self._ring) // 2
+        chunk = chunk[-size:]
+        n = len(chunk)
+        start = self._write
+        end = start + n
+        if end <= size:
+            self._ring[start:end] = chunk
+            self._ring[start + size:end + size] = chunk
+        else:
+            head = size - start
+            self._ring[start:size] = chunk[:head]
+            self._ring[start + size:] = chunk[:head]
+            self._ring[:n - head] = chunk[head:]
+            self._ring[size:size + n - head] = chunk[head:]
+        if end >= size:
+            self._filled = True
+        self._write = end % size
+        if self._filled:
+            return self._ring[self._write:self._write + size]
+        return self._ring[:self._write]
+    
+    @staticmethod
+    def _limits_moved(new, cached, tolerance: float = 0.05) -> bool:
+        """Check whether either end of new limits is off by more than a fraction of the cached span"""
+        if cached is None:
+            return True
+        span = cached[1] - cached[0]
+        return abs(new[0] - cached[0]) > tolerance * span or abs(new[1] - cached[1]) > tolerance * span
     
     def clear_waveform(self):
         """Clear the waveform display"""
         try:
+            self._ensure_figure()
+            self._show_native(False)
             self.audio_data = None
             self.sample_rate = None
             self.time_axis = None
+            self._xlim_cache = None
+            self._ylim_cache = None
+            self._line_x_key = None
             
             # Clear the line
             self.line.set_data([], [])  # type: ignore
@@ -169,12 +580,25 @@ class AudioVisualizer:
             self.ax.set_ylim(-1, 1)  # type: ignore
             
             # Redraw the canvas
-            if self.canvas:
-                self.canvas.draw_idle()
+            self._schedule_redraw(full=True)
                 
         except Exception as e:
             print(f"Error clearing waveform: {e}")
     
+    def redraw(self, audio_data: np.ndarray, sample_rate: int):
+        """
+        Redraw the existing canvas with new audio data
+        
+        Args:
+            audio_data: Audio data as numpy array
+            sample_rate: Sample rate of the audio
+        """
+        self.update_waveform(audio_data, sample_rate)
+    
+    def clear(self):
+        """Clear the existing canvas"""
+        self.clear_waveform()
+    
     def set_color(self, color: str):
         """
         Set the waveform color
@@ -183,9 +607,9 @@ class AudioVisualizer:
             color: Color string (e.g., 'green', 'red', 'blue')
         """
         try:
+            self._ensure_figure()
             self.line.set_color(color)  # type: ignore
-            if self.canvas:
-                self.canvas.draw_idle()
+            self._redraw_line()
         except Exception as e:
             print(f"Error setting color: {e}")
     
@@ -197,9 +621,9 @@ class AudioVisualizer:
             width: Line width in points
         """
         try:
+            self._ensure_figure()
             self.line.set_linewidth(width)  # type: ignore
-            if self.canvas:
-                self.canvas.draw_idle()
+            self._redraw_line()
         except Exception as e:
             print(f"Error setting line width: {e}")
     
@@ -211,6 +635,7 @@ class AudioVisualizer:
             max_points: Maximum number of points
         """
         self.max_points = max_points
+        self._decim_cache = None
     
     def get_audio_data(self) -> Optional[np.ndarray]:
         """Get the current audio data"""
@@ -234,7 +659,16 @@ class AudioVisualizer:
             filename: Output filename
         """
         try:
-            self.fig.savefig(filename, facecolor='black', edgecolor='none', bbox_inches='tight', dpi=300)  # type: ignore
+            self._ensure_figure()
+            # Animated artists are skipped by savefig, so include the line for the export,
+            # antialiased for the high resolution image
+            self.line.set_animated(False)  # type: ignore
+            self.line.set_antialiased(True)  # type: ignore
+            try:
+                self.fig.savefig(filename, facecolor='black', edgecolor='none', bbox_inches='tight', dpi=300)  # type: ignore
+            finally:
+                self.line.set_antialiased(False)  # type: ignore
+                self.line.set_animated(True)  # type: ignore
             print(f"Plot saved as {filename}")
         except Exception as e:
             print(f"Error saving plot: {e}")
@@ -247,24 +681,27 @@ class AudioVisualizer:
             audio_data: Audio data as numpy array
             sample_rate: Sample rate of the audio
         """
+        from scipy import signal
+        
         try:
+            self._ensure_figure()
             # Clear current plot
+            self._show_native(False)
             self.ax.clear()  # type: ignore
             
-            # Create spectrogram
-            self.ax.specgram(audio_data, Fs=sample_rate, cmap='viridis')  # type: ignore
+            # Compute the spectrogram in C and show it as a single image, in dB
+            audio_data = _as_float32_1d(audio_data)
+            _, _, sxx = signal.spectrogram(audio_data, fs=sample_rate, window='hann',
+                                           nperseg=256, noverlap=128)
+            sxx += 1e-10
+            np.log10(sxx, out=sxx)
+            sxx *= 10
+            duration = len(audio_data) / sample_rate
+            self.ax.imshow(sxx, aspect='auto', origin='lower', cmap='viridis',  # type: ignore
+                           extent=(0, duration, 0, sample_rate / 2))
             
             # Configure axes
-            self.ax.set_xlabel('Time (s)', color='white')  # type: ignore
-            self.ax.set_ylabel('Frequency (Hz)', color='white')  # type: ignore
-            self.ax.set_title('Audio Spectrogram', color='white', fontsize=14, fontweight='bold')  # type: ignore
-            
-            # Set axis colors
-            self.ax.spines['bottom'].set_color('white')  # type: ignore
-            self.ax.spines['top'].set_color('white')  # type: ignore
-            self.ax.spines['left'].set_color('white')  # type: ignore
-            self.ax.spines['right'].set_color('white')  # type: ignore
-            self.ax.tick_params(colors='white')  # type: ignore
+            self._style_axes(self.ax, 'Frequency (Hz)', 'Audio Spectrogram')
             
             # Redraw the canvas
             if self.canvas:
@@ -276,15 +713,23 @@ class AudioVisualizer:
     def switch_to_waveform(self):
         """Switch back to waveform display"""
         try:
-            # Clear current plot
+            self._ensure_figure()
+            # Clear the current plot, keeping the figure and canvas
+            old_line = self.line
             self.ax.clear()  # type: ignore
             
-            # Recreate the waveform plot
-            self._setup_plot()
+            # Restyle the axes and recreate the line with its current look
+            self._setup_waveform_axes(old_line.get_color(), old_line.get_linewidth())  # type: ignore
+            self._xlim_cache = None
+            self._ylim_cache = None
+            self._line_x_key = None
             
             # Update with current data if available
             if self.audio_data is not None and self.sample_rate is not None:
                 self.update_waveform(self.audio_data, self.sample_rate)
+            elif self.canvas:
+                self._show_native(False)
+                self.canvas.draw_idle()
                 
         except Exception as e:
             print(f"Error switching to waveform: {e}") 
\ No newline at end of file